@@ -5,27 +5,30 @@ from typing import Callable
 from import_me.constants import COLUMN_NAME_PATTERN
 from import_me.exceptions import ParserError
 
+COLUMN_NAME_RE = re.compile(COLUMN_NAME_PATTERN)
+
 
 class Column:
+    __slots__ = ('name', 'index', 'processor', 'header', 'validate_header', 'required', 'unique', 'intern')
+
     def __init__(
         self, name: str, index: int, processor: typing.Optional[Callable] = None,
         header: typing.Optional[str] = None, validate_header: bool = True,
-        required: bool = False, unique: bool = False,
+        required: bool = False, unique: bool = False, intern: bool = False,
     ):
         self.name = name
         self.index = index
-        if processor:  # noqa: IFSTMT001 (this is for mypy)
-            self.processor = processor
-        else:
-            self.processor = lambda x: x
+        self.processor = processor
         self.header = header
         self.validate_header = validate_header
         self.required = required
         self.unique = unique
+        # low-cardinality string columns share one object per distinct value
+        self.intern = intern
 
         self._check_name()
 
     def _check_name(self) -> None:
-        if not re.match(COLUMN_NAME_PATTERN, self.name):
+        if not COLUMN_NAME_RE.match(self.name):
             raise ParserError(
                 f'Column name {self.name} does not match the pattern {COLUMN_NAME_PATTERN}.')
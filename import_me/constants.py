@@ -33,3 +33,9 @@ WHITESPACES = (
     '\ufeff'  # 65279
 )
 COLUMN_NAME_PATTERN = '^[a-z][a-z0-9_]*$'
+
+# https://support.microsoft.com/en-us/office/excel-specifications-and-limits-1672b34d-7043-467e-8e27-269d656771c3
+XLSX_MAX_ROW = 1048576
+XLSX_MAX_COLUMN = 16384
+
+CSV_READ_BUFFER_SIZE = 1024 * 1024
@@ -3,6 +3,7 @@ import dataclasses
 import datetime
 import decimal
 import pathlib
+import sys
 import types
 import typing
 
@@ -27,6 +28,7 @@ META_HEADER = 'im_header'
 META_VALIDATE_HEADER = 'im_validate_header'
 META_UNIQUE = 'im_unique'
 META_PROCESSOR = 'im_processor'
+META_INTERN = 'im_intern'
 
 PROCESSORS_BY_TYPE: typing.Dict[type, BaseProcessor] = {
     int: IntegerProcessor(),
@@ -39,6 +41,10 @@ PROCESSORS_BY_TYPE: typing.Dict[type, BaseProcessor] = {
 }
 
 
+# slots make attribute access cheaper, dataclasses support them since python 3.10
+DATACLASS_OPTIONS: typing.Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
 def infer_processor_by_type(field_type: typing.Any) -> typing.Optional[BaseProcessor]:
     return PROCESSORS_BY_TYPE.get(field_type, None)
 
@@ -47,7 +53,7 @@ class _NOT_SPECIFIED:
     pass
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(**DATACLASS_OPTIONS)
 class DtoField:
     name: str
     index: int
@@ -57,6 +63,7 @@ class DtoField:
     unique: bool
     processor: BaseProcessor
     default: typing.Any = _NOT_SPECIFIED
+    intern: bool = False
 
 
 class DtoFieldsGetter(typing_extensions.Protocol):
@@ -112,6 +119,7 @@ def get_pydantic_fields(dto: PydanticLikeDto) -> list[DtoField]:
                     META_PROCESSOR, infer_processor_by_type(pydantic_field.type_),
                 ),
                 default=pydantic_field.default or _NOT_SPECIFIED,
+                intern=pydantic_field.field_info.extra.get(META_INTERN, False),
             ),
         )
     return fields
@@ -140,6 +148,7 @@ def get_dataclass_fields(dto: DataclassLikeDto) -> list[DtoField]:
                     if dataclass_field.default is not dataclasses.MISSING
                     else _NOT_SPECIFIED
                 ),
+                intern=dataclass_field.metadata.get(META_INTERN, False),
             ),
         )
     return fields
@@ -156,7 +165,7 @@ T = typing.TypeVar('T', bound=typing.Union[
 ])
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(**DATACLASS_OPTIONS)
 class ParsingResult(typing.Generic[T]):
     parsed_items: list[T]
     errors: dict[typing.Optional[int], typing.List[str]]
@@ -176,6 +185,10 @@ class BaseImportableDtoMixin(abc.ABC):
 
     parser_base: typing.Type[BaseParser] = import_me.BaseXLSXParser
     fields_getter: DtoFieldsGetter
+    _import_me_fields: typing.List[DtoField]
+    _import_me_parser_cache: typing.Tuple[
+        typing.List[DtoField], typing.Type[BaseParser], typing.Dict[str, typing.Any], typing.Type[BaseParser],
+    ]
 
     @classmethod
     def parse_from_file(
@@ -185,7 +198,7 @@ class BaseImportableDtoMixin(abc.ABC):
         *args: typing.Any,
         **kwargs: typing.Any,
     ) -> ParsingResult[T]:
-        fields = cls.fields_getter(cls)
+        fields = cls._get_fields()
         parser = cls._construct_parser(
             fields=fields, file_path=file_path, file_contents=file_contents, *args, **kwargs,
         )
@@ -193,6 +206,15 @@ class BaseImportableDtoMixin(abc.ABC):
         parsed_items = cls._serialize_cleaned_data(parser=parser, fields=fields)
         return ParsingResult(parsed_items, parser.errors_by_row)
 
+    @classmethod
+    def _get_fields(cls) -> typing.List[DtoField]:
+        # DTO fields don't change after the class is created, so they are collected once per DTO class
+        fields = cls.__dict__.get('_import_me_fields')
+        if fields is None:
+            fields = cls.fields_getter(cls)
+            cls._import_me_fields = fields
+        return fields
+
     @classmethod
     def _get_columns(cls, fields: list[DtoField]) -> typing.List[Column]:
         columns = []
@@ -206,6 +228,7 @@ class BaseImportableDtoMixin(abc.ABC):
                     validate_header=field.validate_header,
                     required=field.required,
                     unique=field.unique,
+                    intern=field.intern,
                 ),
             )
         return columns
@@ -219,13 +242,25 @@ class BaseImportableDtoMixin(abc.ABC):
         *args: typing.Any,
         **kwargs: typing.Any,
     ) -> BaseParser:
-        class DtoParser(cls.parser_base):
-            columns = cls._get_columns(fields)
+        parser_class = cls._get_parser_class(fields)
+        return parser_class(file_path, file_contents, *args, **kwargs)
 
-        for key, value in cls.ParserMeta.__dict__.items():
-            if not key.startswith('__'):
-                setattr(DtoParser, key, value)
-        return DtoParser(file_path, file_contents, *args, **kwargs)
+    @classmethod
+    def _get_parser_class(cls, fields: typing.List[DtoField]) -> typing.Type[BaseParser]:
+        parser_meta = {
+            key: value
+            for key, value in cls.ParserMeta.__dict__.items()
+            if not key.startswith('__')
+        }
+        # the parser class is reused for every parsed file while the fields, parser base and ParserMeta stay the same
+        cache = cls.__dict__.get('_import_me_parser_cache')
+        if cache is not None and cache[0] is fields and cache[1] is cls.parser_base and cache[2] == parser_meta:
+            return cache[3]
+        parser_class = type(
+            'DtoParser', (cls.parser_base,), {'columns': cls._get_columns(fields), **parser_meta},
+        )
+        cls._import_me_parser_cache = (fields, cls.parser_base, parser_meta, parser_class)
+        return parser_class
 
     @classmethod
     def _serialize_cleaned_data(
@@ -234,14 +269,17 @@ class BaseImportableDtoMixin(abc.ABC):
         defaults = {field.name: field.default for field in fields}
         parsed_items: typing.List[T] = []
         for row in parser.cleaned_data:
-            dto_kwargs = {}
-            for key, value in row.items():
-                if value is not None:
-                    dto_kwargs[key] = value
-                else:
-                    default_value = defaults.get(key)
-                    if default_value is not _NOT_SPECIFIED:
-                        dto_kwargs[key] = default_value
+            # rows without empty values are passed as is, without building a second dict per row
+            dto_kwargs = row
+            if None in row.values():
+                dto_kwargs = {}
+                for key, value in row.items():
+                    if value is not None:
+                        dto_kwargs[key] = value
+                    else:
+                        default_value = defaults.get(key)
+                        if default_value is not _NOT_SPECIFIED:
+                            dto_kwargs[key] = default_value
             try:
                 parsed_items.append(cls(**dto_kwargs))
             except Exception as e:
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
 import collections
+import concurrent.futures
 import itertools
 import pathlib
+import sys
+import types
 import typing
 from typing import TYPE_CHECKING
 
 from import_me.columns import Column
 from import_me.exceptions import ColumnError, ParserError, SkipRow, StopParsing
+from import_me.processors import BaseProcessor
 
 if TYPE_CHECKING:
-    from typing import List, Dict, Tuple, Any, Type, Union, IO, Iterator, DefaultDict, Optional
+    from typing import List, Dict, Mapping, Tuple, Any, Type, Union, IO, Iterator, Optional, Callable
+
+    ColumnPlanItem = Tuple[Column, str, int, Optional[Callable], Optional[Callable], bool, bool]
+    ColumnPlan = Tuple[ColumnPlanItem, ...]
 
 
 class ParserMixin:
@@ -36,6 +43,7 @@ class ParserMixin:
 class BaseParser(ParserMixin):
     columns: List[Column]
     unique_together: List[List[str]]
+    _expected_headers_cache: Tuple[List[Column], Mapping[int, str]]
 
     def __init__(
         self,
@@ -48,25 +56,116 @@ class BaseParser(ParserMixin):
         self.file_path = file_path
         self.file_contents = file_contents
         self._params = kwargs
-        self._unique_column_values: DefaultDict[str, Dict[Any, int]] = collections.defaultdict(dict)
-        self._unique_together_values: DefaultDict[
-            Tuple[str, ...], Dict[Tuple[Any, ...], int],
-        ] = collections.defaultdict(dict)
+        self._unique_column_values: Dict[str, Dict[Any, int]] = {}
+        self._unique_together_values: Dict[Tuple[str, ...], Dict[Tuple[Any, ...], int]] = {}
+        self._unique_together: Tuple[Tuple[str, ...], ...] = tuple(
+            tuple(unique_together_columns)
+            for unique_together_columns in getattr(self, 'unique_together', ())
+        )
 
     @property
-    def _unique_together(self) -> Tuple[Tuple[str, ...], ...]:
-        if '_unique_together' not in self.__dict__:
-            if hasattr(self, 'unique_together'):
-                value = tuple(
-                    (
-                        tuple(unique_together_columns)
-                        for unique_together_columns in self.unique_together
-                    ),
+    def _expected_headers(self) -> Mapping[int, str]:
+        """Headers are validated for every file, so they are collected once per parser class and columns list."""
+        parser_class, columns = type(self), self.columns
+        cache = parser_class.__dict__.get('_expected_headers_cache')
+        if cache is None or cache[0] is not columns:
+            # read-only, the mapping is shared by all parser instances
+            cache = parser_class._expected_headers_cache = (columns, types.MappingProxyType({
+                column.index: column.header.lower()
+                for column in columns
+                if column.header and column.validate_header
+            }))
+        return cache[1]
+
+    @property
+    def _column_clean_funcs(self) -> Dict[str, Optional[Callable]]:
+        """clean_column_<name> methods by column name, looked up once per parser."""
+        if '_column_clean_funcs' not in self.__dict__:
+            self.__dict__['_column_clean_funcs'] = {
+                column.name: getattr(self, f'clean_column_{column.name}', None)
+                for column in self.columns
+            }
+        return self.__dict__['_column_clean_funcs']
+
+    @property
+    def _column_plan(self) -> ColumnPlan:
+        """Column attributes and clean methods, resolved once per parser instead of once per cell."""
+        if '_column_plan' not in self.__dict__:
+            self.__dict__['_column_plan'] = tuple(
+                (
+                    column,
+                    column.name,
+                    column.index,
+                    column.processor,
+                    self._column_clean_funcs[column.name],
+                    column.unique,
+                    column.intern,
                 )
-            else:
-                value = ()
-            self.__dict__['_unique_together'] = value
-        return self.__dict__['_unique_together']
+                for column in self.columns
+            )
+        return self.__dict__['_column_plan']
+
+    @property
+    def _column_hooks_overridden(self) -> bool:
+        """parse_column or clean_column is overridden, so cells can't be parsed inline."""
+        if '_column_hooks_overridden' not in self.__dict__:
+            parser_class = type(self)
+            self.__dict__['_column_hooks_overridden'] = (
+                parser_class.parse_column is not BaseParser.parse_column
+                or parser_class.clean_column is not BaseParser.clean_column
+            )
+        return self.__dict__['_column_hooks_overridden']
+
+    @property
+    def _row_hooks_overridden(self) -> bool:
+        """clean_row or one of the row checks is overridden, so empty rows have to reach clean_row."""
+        if '_row_hooks_overridden' not in self.__dict__:
+            parser_class = type(self)
+            self.__dict__['_row_hooks_overridden'] = (
+                parser_class.clean_row is not BaseParser.clean_row
+                or parser_class.clean_row_required_columns is not BaseParser.clean_row_required_columns
+                or parser_class.clean_unique_together_values is not BaseParser.clean_unique_together_values
+            )
+        return self.__dict__['_row_hooks_overridden']
+
+    @property
+    def _empty_rows_skipped_early(self) -> bool:
+        """Empty cells can't become values or errors and no hook sees empty rows, so they are skipped before parsing."""
+        if '_empty_rows_skipped_early' not in self.__dict__:
+            self.__dict__['_empty_rows_skipped_early'] = (
+                not self._column_hooks_overridden and not self._row_hooks_overridden and all(
+                    clean_func is None and (
+                        processor is None
+                        or isinstance(processor, BaseProcessor) and type(processor).__call__ is BaseProcessor.__call__
+                    )
+                    for column, name, index, processor, clean_func, unique, intern in self._column_plan
+                )
+            )
+        return self.__dict__['_empty_rows_skipped_early']
+
+    @property
+    def _column_names(self) -> Tuple[str, ...]:
+        if '_column_names' not in self.__dict__:
+            self.__dict__['_column_names'] = tuple(column.name for column in self.columns)
+        return self.__dict__['_column_names']
+
+    @property
+    def _required_columns(self) -> Tuple[Column, ...]:
+        if '_required_columns' not in self.__dict__:
+            self.__dict__['_required_columns'] = tuple(column for column in self.columns if column.required)
+        return self.__dict__['_required_columns']
+
+    @property
+    def _required_column_names(self) -> Tuple[str, ...]:
+        if '_required_column_names' not in self.__dict__:
+            self.__dict__['_required_column_names'] = tuple(column.name for column in self._required_columns)
+        return self.__dict__['_required_column_names']
+
+    @property
+    def _column_indexes(self) -> Tuple[int, ...]:
+        if '_column_indexes' not in self.__dict__:
+            self.__dict__['_column_indexes'] = tuple(column.index for column in self.columns)
+        return self.__dict__['_column_indexes']
 
     @staticmethod
     def _column_header_compare(
@@ -85,7 +184,7 @@ class BaseParser(ParserMixin):
         return f'column {column} «{given_value}» not equal expected «{expected_value}»'
 
     @staticmethod
-    def _sorted_dict(_dict: Dict) -> List:
+    def _sorted_dict(_dict: Mapping) -> List:
         return sorted(_dict.items(), key=lambda x: x[0])
 
     @staticmethod
@@ -94,9 +193,12 @@ class BaseParser(ParserMixin):
 
     def check_column_headers(
         self,
-        expected_headers: Dict[int, str],
+        expected_headers: Mapping[int, str],
         given_headers: Dict[int, str],
     ) -> List[str]:
+        if expected_headers == given_headers:
+            return []
+
         err_messages: List[str] = []
         for expected, given in itertools.zip_longest(
             self._sorted_dict(expected_headers),
@@ -114,28 +216,34 @@ class BaseParser(ParserMixin):
     def iterate_file_rows(self) -> Iterator[Tuple[int, List[Any]]]:
         raise NotImplementedError
 
-    def parse(self) -> None:
-        data = []
-
+    def parse_iter(self) -> Iterator[Dict]:
+        """Lazily parse file rows, `clean` is not applied."""
         for row_index, row in self.iterate_file_rows():
             try:
                 row_data = self.parse_row(row, row_index)
             except SkipRow:
-                pass
-            else:
-                data.append(row_data)
+                continue
+            if row_data is not None:
+                yield row_data
 
-        self.cleaned_data = self.clean(data)
+    def parse(self) -> None:
+        self.cleaned_data = self.clean(list(self.parse_iter()))
 
-    def parse_row(self, row: List[Any], row_index: int, worksheet_title: Optional[str] = None) -> Dict:
+    def parse_row(self, row: List[Any], row_index: int, worksheet_title: Optional[str] = None) -> Optional[Dict]:
+        """Parse a single row, return None if the row has to be skipped."""
         row_data = {}
         if worksheet_title:
             row_data['worksheet'] = worksheet_title
         row_has_errors = False
 
-        for column in self.columns:
+        # skip empty rows before running processors on every empty cell
+        if self.skip_empty_rows and self._empty_rows_skipped_early and self._is_empty_row(row):
+            return None
+
+        for column_plan in self._column_plan:
+            column = column_plan[0]
             try:
-                row_data[column.name] = self.parse_column(row, column, row_index)
+                row_data[column.name] = self._parse_cell(row, column_plan, row_index)
             except ColumnError as e:
                 row_has_errors = True
                 self.add_errors(
@@ -146,30 +254,63 @@ class BaseParser(ParserMixin):
                 )
 
         if row_has_errors:
-            raise SkipRow('Not processed because the string contains errors.')
+            return None
 
         return self.clean_row(row_data, row, row_index, worksheet_title=worksheet_title)
 
-    def parse_column(self, row: List[Any], column: Column, row_index: int) -> Any:
+    def _is_empty_row(self, row: List[Any]) -> bool:
+        row_length = len(row)
+        return all(row[index] is None for index in self._column_indexes if index < row_length)
+
+    def _parse_cell(self, row: List[Any], column_plan: ColumnPlanItem, row_index: int) -> Any:
+        column, name, index, processor, clean_func, unique, intern = column_plan
+        if self._column_hooks_overridden:
+            value = self.parse_column(row, column, row_index)
+        else:
+            # parse_column and clean_column are inlined here, this runs for every cell of the file
+            value = self._process_cell_value(row[index] if index < len(row) else None, column_plan, row_index)
+        if intern and type(value) is str:
+            value = sys.intern(value)
+        return value
+
+    def _process_cell_value(self, value: Any, column_plan: ColumnPlanItem, row_index: int) -> Any:
+        column, name, index, processor, clean_func, unique, intern = column_plan
         try:
-            value = row[column.index]
-        except IndexError:
-            value = None
+            if processor is not None:
+                value = processor(value)
+            if clean_func is not None:
+                value = clean_func(value)
+            if unique:
+                value = self.clean_unique_value(column, value, row_index)
+        except (StopParsing, ColumnError) as e:
+            raise e
+        except Exception as e:
+            raise ColumnError(getattr(e, 'messages', str(e))) from e
+        return value
+
+    def parse_column(self, row: List[Any], column: Column, row_index: int) -> Any:
+        value = row[column.index] if column.index < len(row) else None
 
         try:
-            value = column.processor(value)
+            if column.processor is not None:
+                value = column.processor(value)
             value = self.clean_column(column, value)
             value = self.clean_unique_value(column, value, row_index)
-        except StopParsing as e:
+        except (StopParsing, ColumnError) as e:
             raise e
         except Exception as e:
             raise ColumnError(getattr(e, 'messages', str(e))) from e
 
         return value
 
-    def clean_row(self, row_data: Dict, row: List[Any], row_index: int, worksheet_title: Optional[str] = None) -> Dict:
-        if self.skip_empty_rows and all((row_data.get(column.name) is None for column in self.columns)):
-            raise SkipRow
+    def clean_row(
+        self, row_data: Dict, row: List[Any], row_index: int, worksheet_title: Optional[str] = None,
+    ) -> Dict:
+        if self.skip_empty_rows:
+            # count(None) walks the values in C instead of a generator per row
+            values = list(map(row_data.get, self._column_names))
+            if values.count(None) == len(values):
+                raise SkipRow
 
         row_data = self.clean_row_required_columns(row_data, row, row_index, worksheet_title=worksheet_title)
         row_data = self.clean_unique_together_values(row_data, row, row_index, worksheet_title=worksheet_title)
@@ -184,10 +325,13 @@ class BaseParser(ParserMixin):
     def clean_row_required_columns(
         self, row_data: Dict, row: List[Any], row_index: int, worksheet_title: Optional[str] = None,
     ) -> Dict:
-        has_empty_required_columns = False
+        # rows with all required values filled are checked without a python level loop
+        if None not in map(row_data.get, self._required_column_names):
+            return row_data
 
-        for column in self.columns:
-            if column.required and row_data.get(column.name) is None:
+        has_empty_required_columns = False
+        for column in self._required_columns:
+            if row_data.get(column.name) is None:
                 self.add_errors(
                     f'Column {column.header or column.name} is required.',
                     row_index=row_index, col_index=column.index, worksheet_title=worksheet_title,
@@ -204,17 +348,17 @@ class BaseParser(ParserMixin):
     ) -> Dict:
         is_not_unique_row = False
 
-        if not self._unique_together:
+        unique_together = self._unique_together
+        if not unique_together:
             return row_data
 
-        for unique_together_columns in self._unique_together:
-            values = tuple((
-                row_data[column_name]
-                for column_name in unique_together_columns
-                if row_data[column_name] is not None
-            ))
-            if len(values) == len(unique_together_columns):
-                duplicate_row = self._unique_together_values[unique_together_columns].get(values, None)
+        for unique_together_columns in unique_together:
+            values = tuple(map(row_data.__getitem__, unique_together_columns))
+            if None not in values:
+                seen_values = self._unique_together_values.get(unique_together_columns)
+                if seen_values is None:
+                    seen_values = self._unique_together_values[unique_together_columns] = {}
+                duplicate_row = seen_values.get(values, None)
                 if duplicate_row:
                     error = ', '.join((
                         f'{column_name} ({column_value})'
@@ -226,7 +370,7 @@ class BaseParser(ParserMixin):
                     )
                     is_not_unique_row = True
                 else:
-                    self._unique_together_values[unique_together_columns][values] = row_index
+                    seen_values[values] = row_index
 
         if is_not_unique_row:
             raise SkipRow(f'Row {row_index} is not unique.')
@@ -234,18 +378,24 @@ class BaseParser(ParserMixin):
         return row_data
 
     def clean_column(self, column: Column, value: Any) -> Any:
-        column_clean_func = getattr(self, f'clean_column_{column.name}', None)
+        try:
+            column_clean_func = self._column_clean_funcs[column.name]
+        except KeyError:
+            column_clean_func = getattr(self, f'clean_column_{column.name}', None)
         if column_clean_func:
             value = column_clean_func(value)
         return value
 
     def clean_unique_value(self, column: Column, value: Any, row_index: int) -> Any:
         if value is not None and column.unique:
-            duplicate_row = self._unique_column_values[column.name].get(value, None)
+            seen_values = self._unique_column_values.get(column.name)
+            if seen_values is None:
+                seen_values = self._unique_column_values[column.name] = {}
+            duplicate_row = seen_values.get(value, None)
             if duplicate_row is not None:
                 raise ColumnError(f'value {value} is a duplicate of row {duplicate_row}')
             else:
-                self._unique_column_values[column.name][value] = row_index
+                seen_values[value] = row_index
         return value
 
     def clean(self, data: List) -> List:
@@ -260,17 +410,21 @@ class BaseParser(ParserMixin):
     ) -> None:
         if not isinstance(messages, list):
             messages = [messages]
-        for message in messages:
-            error = []
-            if worksheet_title is not None:
-                error.append(f'worksheet: {worksheet_title}')
-            if row_index is not None:
-                error.append(f'row: {row_index}')
-            if col_index is not None:
-                error.append(f'column: {col_index}')
-            error.append(message)
-            self.errors.append(', '.join(error))
-            self.errors_by_row[row_index].append(', '.join(error))
+        if not messages:
+            return
+
+        # the location prefix is the same for all messages
+        prefix = ''
+        if worksheet_title is not None:
+            prefix += f'worksheet: {worksheet_title}, '
+        if row_index is not None:
+            prefix += f'row: {row_index}, '
+        if col_index is not None:
+            prefix += f'column: {col_index}, '
+
+        error_messages = [f'{prefix}{message}' for message in messages]
+        self.errors.extend(error_messages)
+        self.errors_by_row[row_index].extend(error_messages)
 
     def parse_data(self, raise_errors: bool = False, *args: Any, **kwargs: Any) -> None:
         try:
@@ -287,23 +441,29 @@ class BaseParser(ParserMixin):
         return self.parse_data(raise_errors, *args, **kwargs)
 
     def _parse(self) -> None:
-        data = []
+        self.cleaned_data = self.clean(list(self.parse_iter()))
 
-        for row_index, row in self.iterate_file_rows():
-            try:
-                row_data = self.parse_row(row, row_index)
-            except SkipRow:
-                pass
-            else:
-                data.append(row_data)
 
-        self.cleaned_data = self.clean(data)
+def parse_file(
+    parser_class: Type[BaseParser], file_path: pathlib.Path, raise_errors: bool = False,
+) -> Tuple[List[Dict[str, Any]], Union[List, str]]:
+    """Parse a single file and return its cleaned data and errors.
+
+    Module level function, so it can be sent to worker processes.
+    """
+    try:
+        parser = parser_class(file_path)
+        parser(raise_errors=raise_errors)
+    except Exception as e:
+        return [], getattr(e, 'messages', str(e))
+    return parser.cleaned_data, parser.errors
 
 
 class BaseMultipleFileParser(ParserMixin):
     parser_class: Type[BaseParser]
     dir_path: pathlib.Path
     filename_patterns: List[str]
+    max_workers: Optional[int] = 1
 
     def __init__(
         self,
@@ -317,11 +477,9 @@ class BaseMultipleFileParser(ParserMixin):
             self.dir_path = dir_path
 
     def get_file_paths(self) -> List[pathlib.Path]:
-        paths = []
-        for filename_pattern in self.filename_patterns:
-            for file_path in self.dir_path.glob(filename_pattern):
-                paths.append(file_path)
-        return sorted(paths)
+        return sorted(itertools.chain.from_iterable(
+            self.dir_path.glob(filename_pattern) for filename_pattern in self.filename_patterns
+        ))
 
     def add_errors(self, messages: Union[List, str], file_path: pathlib.Path) -> None:
         if not isinstance(messages, list):
@@ -330,21 +488,36 @@ class BaseMultipleFileParser(ParserMixin):
             self.errors.append(f'{file_path}, {message}')
 
     def parse_data(self, raise_errors: bool = False, *args: Any, **kwargs: Any) -> None:
-        for file_path in self.get_file_paths():
-            try:
-                parser = self.parser_class(file_path)
-                parser(raise_errors=raise_errors)
-            except Exception as e:
-                messages = getattr(e, 'messages', str(e))
-                self.add_errors(messages, file_path)
-            else:
-                if parser.has_errors:
-                    self.add_errors(parser.errors, file_path)
-                self.cleaned_data.extend(parser.cleaned_data)
+        """Parse all files, in `max_workers` processes if it is greater than 1.
+
+        `max_workers = None` uses a process per CPU core.
+
+        `parser_class` has to be importable to be used in worker processes.
+        """
+        file_paths = self.get_file_paths()
+        parser_classes = itertools.repeat(self.parser_class)
+        raise_errors_flags = itertools.repeat(raise_errors)
+
+        if self.max_workers is None or self.max_workers > 1:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                results = executor.map(parse_file, parser_classes, file_paths, raise_errors_flags)
+                self._collect_results(file_paths, results)
+        else:
+            self._collect_results(file_paths, map(parse_file, parser_classes, file_paths, raise_errors_flags))
 
         if raise_errors and self.has_errors:
             raise ParserError(self.errors)
 
+    def _collect_results(
+        self,
+        file_paths: List[pathlib.Path],
+        results: Iterator[Tuple[List[Dict[str, Any]], Union[List, str]]],
+    ) -> None:
+        for file_path, (cleaned_data, errors) in zip(file_paths, results):
+            if errors:
+                self.add_errors(errors, file_path)
+            self.cleaned_data.extend(cleaned_data)
+
     def __call__(self, raise_errors: bool = False, *args: Any, **kwargs: Any) -> None:
         # for backward compatibility, deprecated
         return self.parse_data(raise_errors, *args, **kwargs)
@@ -1,12 +1,18 @@
+from __future__ import annotations
+
 import csv
 import io
+import itertools
 from contextlib import contextmanager
+from typing import TYPE_CHECKING
 
-from typing import Optional, Iterator, Tuple, List, Any, Dict
-
+from import_me.constants import CSV_READ_BUFFER_SIZE
 from import_me.exceptions import StopParsing
 from import_me.parsers.base import BaseParser
 
+if TYPE_CHECKING:
+    from typing import Optional, Iterator, Tuple, List, Any, Dict
+
 
 class BaseCSVParser(BaseParser):
     header_row_index: Optional[int] = None
@@ -26,11 +32,13 @@ class BaseCSVParser(BaseParser):
 
     @property
     def _open_file_params(self) -> Dict[str, Any]:
-        return {
+        params = {
             key: self._params[key]
             for key in ['encoding', 'buffering', 'newline', 'errors']
             if key in self._params
         }
+        params.setdefault('buffering', CSV_READ_BUFFER_SIZE)
+        return params
 
     @property
     def _reader_params(self) -> Dict[str, Any]:
@@ -52,7 +60,13 @@ class BaseCSVParser(BaseParser):
         elif self.file_contents:
             data = self.file_contents.read()
             if isinstance(data, bytes):
-                yield io.StringIO(data.decode())
+                # decoded by chunks while reading, without a second full copy of the file as str
+                yield io.TextIOWrapper(
+                    io.BytesIO(data),
+                    encoding=self._params.get('encoding', 'utf-8'),
+                    errors=self._params.get('errors'),
+                    newline='',
+                )
             else:
                 yield data
 
@@ -60,31 +74,32 @@ class BaseCSVParser(BaseParser):
         with self.open_file() as csv_file:
             reader = csv.reader(csv_file, **self._reader_params)
 
-            self.validate_headers(reader)
-            csv_file.seek(0)
+            read_rows_count = self.validate_headers(reader)
+            if read_rows_count > self.first_data_row_index:
+                # the header is below the first data row, so the file is read from the start again
+                csv_file.seek(0)
+                read_rows_count = 0
 
-            for row_index, row in enumerate(reader):
-                if row_index < self.first_data_row_index:
-                    continue
-                if self.last_data_row_index is not None and row_index >= self.last_data_row_index:
-                    break
-
-                yield row_index, row
+            # rows outside of the data range are skipped by islice without per-row checks
+            start = self.first_data_row_index - read_rows_count
+            stop = None
+            if self.last_data_row_index is not None:
+                stop = max(self.last_data_row_index - read_rows_count, 0)
+            yield from itertools.islice(enumerate(reader, read_rows_count), start, stop)
 
-    def validate_headers(self, reader: Iterator[List[str]]) -> None:
-        expected_headers = {
-            column.index: column.header.lower()
-            for column in self.columns
-            if column.header and column.validate_header
-        }
+    def validate_headers(self, reader: Iterator[List[str]]) -> int:
+        """Validate the header row, return the number of rows read from the reader."""
+        expected_headers = self._expected_headers
+        read_rows_count = 0
         if expected_headers and self.header_row_offset is not None:
             for row_index, row in enumerate(reader):
+                read_rows_count += 1
                 if row_index >= self.header_row_offset:
-                    columns = {
-                        idx: col.strip().lower()
-                        if isinstance(col, str) else col
-                        for idx, col in enumerate(row) if idx in expected_headers
-                    }
+                    row_length = len(row)
+                    columns: Dict[int, Any] = {}
+                    for idx in expected_headers:
+                        value = row[idx] if idx < row_length else None
+                        columns[idx] = value.strip().lower() if isinstance(value, str) else value
 
                     err_messages = self.check_column_headers(expected_headers, columns)
 
@@ -94,3 +109,4 @@ class BaseCSVParser(BaseParser):
                             [f'Incorrect column names in the file: {file_path}.'] + err_messages,
                         )
                     break
+        return read_rows_count
@@ -1,22 +1,247 @@
 from __future__ import annotations
 
+import concurrent.futures
 import datetime
-from typing import TYPE_CHECKING
+import io
+import itertools
+import os
+import zipfile
+from typing import TYPE_CHECKING, cast
 
 import xlrd
 from openpyxl import Workbook, load_workbook
 from openpyxl.utils.exceptions import InvalidFileException
 from openpyxl.worksheet.worksheet import Worksheet
 
+try:
+    import python_calamine
+except ImportError:  # pragma: no cover
+    python_calamine = None  # type: ignore
+
+from import_me.constants import XLSX_MAX_COLUMN, XLSX_MAX_ROW
 from import_me.parsers.base import BaseParser, ParserMixin
 from import_me.exceptions import StopParsing, SkipRow, ParserError
 
 if TYPE_CHECKING:
-    from typing import Optional, Iterator, Tuple, Any, List
+    from typing import Optional, Iterator, Tuple, Any, List, Union, Dict, IO, Type, Mapping
+
+    from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+
+
+def reset_worksheet_dimensions(worksheet: Union[Worksheet, XlrdWorksheet, CalamineWorksheet]) -> None:
+    """Сброс заведомо неверных размеров листа, записанных в файле.
+
+    Многие генераторы xlsx пишут размер листа A1:A1 или A1:XFD1048576.
+    Read-only openpyxl доверяет этому размеру: в первом случае данные обрезаются,
+    во втором перебирается миллион пустых строк.
+
+    """
+    if not hasattr(worksheet, 'reset_dimensions'):
+        return
+    # only read-only openpyxl worksheets have dimensions to reset
+    read_only_worksheet = cast('ReadOnlyWorksheet', worksheet)
+    if (read_only_worksheet.max_row, read_only_worksheet.max_column) in ((1, 1), (XLSX_MAX_ROW, XLSX_MAX_COLUMN)):
+        read_only_worksheet.reset_dimensions()
+
+
+class _Cell:
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+
+class XlrdWorksheet:
+    """Обёртка над листом xlrd с интерфейсом чтения openpyxl Worksheet.
+
+    Строки читаются из xlrd по одной, без копирования всего листа в openpyxl.
+
+    """
+
+    def __init__(self, xls_sheet: xlrd.sheet.Sheet, datemode: int) -> None:
+        self.xls_sheet = xls_sheet
+        self.datemode = datemode
+
+    @property
+    def title(self) -> str:
+        return self.xls_sheet.name
+
+    def iter_rows(
+        self, min_row: Optional[int] = None, max_row: Optional[int] = None,
+        max_col: Optional[int] = None, values_only: bool = False,
+    ) -> Iterator[Tuple[Any, ...]]:
+        nrows = self.xls_sheet.nrows
+        last_row = min(max_row, nrows) if max_row is not None else nrows
+        for row in range((min_row or 1) - 1, last_row):
+            values = tuple(
+                self._cell_value(value, ctype)
+                for value, ctype in itertools.islice(
+                    zip(self.xls_sheet.row_values(row), self.xls_sheet.row_types(row)), max_col,
+                )
+            )
+            yield values if values_only else tuple(_Cell(value) for value in values)
+
+    def _cell_value(self, value: Any, ctype: int) -> Any:
+        if value and ctype == xlrd.XL_CELL_DATE:
+            value = datetime.datetime(*xlrd.xldate_as_tuple(value, self.datemode))
+        return value
+
+
+class XlrdWorkbook:
+    """Обёртка над книгой xlrd с интерфейсом чтения openpyxl Workbook."""
+
+    def __init__(self, xls_workbook: xlrd.book.Book) -> None:
+        self.worksheets = [
+            XlrdWorksheet(xls_sheet, xls_workbook.datemode)
+            for xls_sheet in xls_workbook.sheets()
+        ]
+
+    @property
+    def sheetnames(self) -> List[str]:
+        return [worksheet.title for worksheet in self.worksheets]
+
+    def __getitem__(self, key: str) -> XlrdWorksheet:
+        for worksheet in self.worksheets:
+            if worksheet.title == key:
+                return worksheet
+        raise KeyError(f'Worksheet {key} does not exist.')
+
+
+class CalamineWorksheet:
+    """Обёртка над листом python-calamine с интерфейсом чтения openpyxl Worksheet.
+
+    Значения приводятся к типам openpyxl: пустые ячейки - None,
+    целые числа - int, даты - datetime.
+
+    """
+
+    def __init__(self, calamine_sheet: python_calamine.CalamineSheet) -> None:
+        self.calamine_sheet = calamine_sheet
+
+    @property
+    def title(self) -> str:
+        return self.calamine_sheet.name
+
+    def iter_rows(
+        self, min_row: Optional[int] = None, max_row: Optional[int] = None,
+        max_col: Optional[int] = None, values_only: bool = False,
+    ) -> Iterator[Tuple[Any, ...]]:
+        # calamine отдаёт строки начиная с первой, а столбцы - начиная с первого непустого
+        start = self.calamine_sheet.start
+        column_offset = (None,) * start[1] if start else ()
+        first_row = (min_row or 1) - 1
+        for row_number, row in enumerate(self.calamine_sheet.iter_rows()):
+            if row_number < first_row:
+                continue
+            if max_row is not None and row_number >= max_row:
+                break
+            values = (column_offset + tuple(row))[:max_col]
+            values = tuple(self._cell_value(value) for value in values)
+            yield values if values_only else tuple(_Cell(value) for value in values)
+
+    @staticmethod
+    def _cell_value(value: Any) -> Any:
+        if value == '':
+            return None
+        if isinstance(value, float):
+            if value.is_integer():
+                return int(value)
+        elif type(value) is datetime.date:
+            return datetime.datetime.combine(value, datetime.time.min)
+        return value
+
+
+class CalamineWorkbook:
+    """Обёртка над книгой python-calamine с интерфейсом чтения openpyxl Workbook."""
+
+    def __init__(self, calamine_workbook: python_calamine.CalamineWorkbook) -> None:
+        self.calamine_workbook = calamine_workbook
+        self.sheetnames: List[str] = calamine_workbook.sheet_names
+
+    @property
+    def worksheets(self) -> List[CalamineWorksheet]:
+        return [self[title] for title in self.sheetnames]
+
+    def __getitem__(self, key: str) -> CalamineWorksheet:
+        if key not in self.sheetnames:
+            raise KeyError(f'Worksheet {key} does not exist.')
+        return CalamineWorksheet(self.calamine_workbook.get_sheet_by_name(key))
+
+
+def load_calamine_workbook(
+    file_path: Optional[Union[str, os.PathLike]], file_contents: Optional[Union[IO, bytes]],
+) -> CalamineWorkbook:
+    if python_calamine is None:
+        raise StopParsing('python-calamine is required to use the calamine reader backend.')
+
+    source = file_path or file_contents
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    # a missing source is rejected by python-calamine itself
+    calamine_source = cast('Union[str, os.PathLike, IO[bytes]]', source)
+    return CalamineWorkbook(python_calamine.CalamineWorkbook.from_object(calamine_source))
+
+
+def read_worksheet_headers(
+    worksheet: Union[Worksheet, XlrdWorksheet, CalamineWorksheet],
+    header_row_number: int,
+    expected_headers: Mapping[int, str],
+) -> Optional[Dict[int, Any]]:
+    """Чтение заголовков колонок листа по их индексам, None если строки заголовков нет в листе."""
+    # only the cells up to the last expected header are read
+    row = next(
+        worksheet.iter_rows(
+            min_row=header_row_number, max_row=header_row_number,
+            max_col=max(expected_headers) + 1, values_only=True,
+        ),
+        None,
+    )
+    if row is None:
+        return None
+    row_length = len(row)
+    headers: Dict[int, Any] = {}
+    for idx in expected_headers:
+        value = row[idx] if idx < row_length else None
+        headers[idx] = value.strip().lower() if isinstance(value, str) else value
+    return headers
+
+
+def get_worksheets_size(file: Optional[Union[str, os.PathLike, IO]]) -> Optional[int]:
+    """Размер всех листов xlsx файла без сжатия, None если файл не является zip архивом."""
+    if file is None:
+        return None
+    position = cast('IO', file).tell() if hasattr(file, 'seek') else None
+    try:
+        with zipfile.ZipFile(file) as xlsx_zip:
+            return sum(
+                info.file_size
+                for info in xlsx_zip.infolist()
+                if info.filename.startswith('xl/worksheets/')
+            )
+    except (zipfile.BadZipFile, OSError, AttributeError, TypeError):
+        return None
+    finally:
+        if position is not None:
+            cast('IO', file).seek(position)
+
+
+def is_small_workbook(file: Optional[Union[str, os.PathLike, IO]], threshold_bytes: Optional[int]) -> bool:
+    """Проверка, что книгу быстрее загрузить целиком, чем читать в read-only режиме.
+
+    Read-only openpyxl быстро открывает файл, но медленнее перебирает строки,
+    поэтому небольшие книги выгоднее загружать полностью.
+
+    """
+    if threshold_bytes is None:
+        return False
+    worksheets_size = get_worksheets_size(file)
+    return worksheets_size is not None and worksheets_size < threshold_bytes
 
 
 class BaseXLSXParser(BaseParser):
     ws_index: int = 0
+    reader_backend: str = 'openpyxl'
+    read_only_threshold_bytes: Optional[int] = None
     header_row_index: Optional[int] = None
     first_data_row_index: int = 1
     last_data_row_index: Optional[int] = None
@@ -35,62 +260,61 @@ class BaseXLSXParser(BaseParser):
         self.validate_workbook(wb)
 
         ws = wb[wb.sheetnames[self.ws_index]]
+        reset_worksheet_dimensions(ws)
         self.validate_worksheet(ws)
 
         row_index = self.first_data_row_index
         min_row = self.first_data_row_index + 1 if self.first_data_row_index is not None else None
         max_row = self.last_data_row_index + 1 if self.last_data_row_index is not None else None
-        for row in ws.iter_rows(min_row=min_row, max_row=max_row):
-            yield row_index, [cell.value for cell in row]
+        for row in ws.iter_rows(min_row=min_row, max_row=max_row, values_only=True):
+            yield row_index, list(row)
             row_index += 1
 
-    def load_workbook(self) -> Workbook:
-        """Загрузка openpyxl Workbook из файла.
+    def load_workbook(self) -> Union[Workbook, XlrdWorkbook, CalamineWorkbook]:
+        """Загрузка Workbook из файла.
 
-        Пробуем загрузить сначала через openpyxl,
+        При reader_backend = 'calamine' файл читается через python-calamine.
+        Иначе пробуем загрузить сначала через openpyxl,
         если он не умеет работать с данным типом файлов,
-        то читаем файл с помощью xlrd.
+        то читаем файл с помощью xlrd без конвертации в openpyxl.
 
         """
+        if self.reader_backend == 'calamine':
+            return self._load_workbook_with_calamine()
+
         try:
             wb = self._load_workbook_from_xlsx()
         except InvalidFileException:
             wb = self._load_workbook_from_xls()
         return wb
 
-    def validate_workbook(self, workbook: Workbook) -> None:
+    def validate_workbook(self, workbook: Union[Workbook, XlrdWorkbook, CalamineWorkbook]) -> None:
         pass
 
-    def validate_worksheet(self, worksheet: Worksheet) -> None:
+    def validate_worksheet(self, worksheet: Union[Worksheet, XlrdWorksheet, CalamineWorksheet]) -> None:
         self.validate_worksheet_headers(worksheet)
 
-    def validate_worksheet_headers(self, worksheet: Worksheet) -> None:
-        expected_headers = {
-            column.index: column.header.lower()
-            for column in self.columns
-            if column.header and column.validate_header
-        }
+    def validate_worksheet_headers(self, worksheet: Union[Worksheet, XlrdWorksheet, CalamineWorksheet]) -> None:
+        expected_headers = self._expected_headers
         if expected_headers and self.header_row_offset is not None:
-            for row in worksheet.iter_rows(min_row=self.header_row_offset + 1):
-                columns = {
-                    idx: col.value.strip().lower()
-                    if isinstance(col.value, str) else col.value
-                    for idx, col in enumerate(row) if idx in expected_headers
-                }
-
-                err_messages = self.check_column_headers(expected_headers, columns)
-
-                if err_messages:
-                    file_path = self.file_path or 'file'
-                    raise StopParsing(
-                        [f'Incorrect column names in the file: {file_path}.'] + err_messages,
-                    )
-                break
+            columns = read_worksheet_headers(worksheet, self.header_row_offset + 1, expected_headers)
+            if columns is None:
+                return
+
+            err_messages = self.check_column_headers(expected_headers, columns)
+
+            if err_messages:
+                file_path = self.file_path or 'file'
+                raise StopParsing(
+                    [f'Incorrect column names in the file: {file_path}.'] + err_messages,
+                )
 
     def _load_workbook_from_xlsx(self) -> Workbook:
-        return load_workbook(filename=self.file_path or self.file_contents, read_only=True, data_only=True)
+        file = self.file_path or self.file_contents
+        read_only = not is_small_workbook(file, self.read_only_threshold_bytes)
+        return load_workbook(filename=file, read_only=read_only, data_only=True)
 
-    def _load_workbook_from_xls(self) -> Workbook:
+    def _load_workbook_from_xls(self) -> XlrdWorkbook:
         file_contents = self.file_contents
         try:
             file_contents = self.file_contents.read()  # type: ignore
@@ -100,22 +324,10 @@ class BaseXLSXParser(BaseParser):
             pass
 
         xls_workbook = xlrd.open_workbook(filename=self.file_path, file_contents=file_contents)
-        xls_sheet = xls_workbook.sheet_by_index(0)
-        nrows = xls_sheet.nrows
-        ncols = xls_sheet.ncols
+        return XlrdWorkbook(xls_workbook)
 
-        wb = Workbook()
-        ws = wb[wb.sheetnames[0]]
-
-        for row in range(nrows):
-            for col in range(ncols):
-                cell = xls_sheet.cell(row, col)
-                value = cell.value
-                if value and cell.ctype == 3:
-                    value = datetime.datetime(*xlrd.xldate_as_tuple(value, xls_workbook.datemode))
-                ws.cell(row=row + 1, column=col + 1).value = value
-
-        return wb
+    def _load_workbook_with_calamine(self) -> CalamineWorkbook:
+        return load_calamine_workbook(self.file_path, self.file_contents)
 
 
 class BaseMultipleXLSXFileParser(ParserMixin):
@@ -127,10 +339,13 @@ class BaseMultipleSheetsXLSXParser(BaseParser):
     first_data_row_index: int = 1
     last_data_row_index: Optional[int] = None
     read_only_workbook: bool = True
+    read_only_threshold_bytes: Optional[int] = None
+    reader_backend: str = 'openpyxl'
+    max_workers: Optional[int] = 1
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
-        self.workbook: Workbook = None
+        self.workbook: Union[Workbook, CalamineWorkbook] = None
 
     @property
     def header_row_offset(self) -> Optional[int]:
@@ -151,11 +366,14 @@ class BaseMultipleSheetsXLSXParser(BaseParser):
         if raise_errors and self.has_errors:
             raise ParserError(self.errors)
 
-    def _load_workbook(self) -> Workbook:
-        """Загрузка openpyxl Workbook из файла."""
+    def _load_workbook(self) -> Union[Workbook, CalamineWorkbook]:
+        """Загрузка Workbook из файла через openpyxl или python-calamine, в зависимости от reader_backend."""
+        if self.reader_backend == 'calamine':
+            return load_calamine_workbook(self.file_path, self.file_contents)
+        file = self.file_path or self.file_contents
         return load_workbook(
-            filename=self.file_path or self.file_contents,
-            read_only=self.read_only_workbook,
+            filename=file,
+            read_only=self.read_only_workbook and not is_small_workbook(file, self.read_only_threshold_bytes),
             data_only=self.read_only_workbook,
         )
 
@@ -163,8 +381,8 @@ class BaseMultipleSheetsXLSXParser(BaseParser):
         row_index = self.first_data_row_index
         min_row = self.first_data_row_index + 1 if self.first_data_row_index is not None else None
         max_row = self.last_data_row_index + 1 if self.last_data_row_index is not None else None
-        for row in worksheet.iter_rows(min_row=min_row, max_row=max_row):
-            yield row_index, [cell.value for cell in row]
+        for row in worksheet.iter_rows(min_row=min_row, max_row=max_row, values_only=True):
+            yield row_index, list(row)
             row_index += 1
 
     def _validate_worksheet(self, worksheet: Worksheet) -> bool:
@@ -181,49 +399,109 @@ class BaseMultipleSheetsXLSXParser(BaseParser):
         return True
 
     def _validate_worksheet_headers(self, worksheet: Worksheet) -> list[str] | None:
-        expected_headers = {
-            column.index: column.header.lower()
-            for column in self.columns
-            if column.header and column.validate_header
-        }
+        expected_headers = self._expected_headers
         if expected_headers and self.header_row_offset is not None:
-            for row in worksheet.iter_rows(min_row=self.header_row_offset + 1):
-                columns = {
-                    idx: col.value.strip().lower()
-                    if isinstance(col.value, str) else col.value
-                    for idx, col in enumerate(row) if idx in expected_headers
-                }
-
-                err_messages = self.check_column_headers(expected_headers, columns)
-
-                if err_messages:
-                    file_path = self.file_path or 'file'
-                    return [
-                        f'Incorrect column names in the file: {file_path}.',
-                        f'Worksheet title: {worksheet.title}.',
-                    ] + err_messages
-                break
+            columns = read_worksheet_headers(worksheet, self.header_row_offset + 1, expected_headers)
+            if columns is None:
+                return None
+
+            err_messages = self.check_column_headers(expected_headers, columns)
+
+            if err_messages:
+                file_path = self.file_path or 'file'
+                return [
+                    f'Incorrect column names in the file: {file_path}.',
+                    f'Worksheet title: {worksheet.title}.',
+                ] + err_messages
 
     def _validate_worksheet_title(self, title: str) -> Optional[str]:
         """Опциональный метод для валидации заголовков страниц файла."""
         pass
 
+    @property
+    def _can_parse_worksheets_in_processes(self) -> bool:
+        # unique values are checked across worksheets, which needs one parser for the whole workbook
+        return (
+            (self.max_workers is None or self.max_workers > 1)
+            and bool(self.file_path)
+            and not self._unique_together
+            and not any(column.unique for column in self.columns)
+        )
+
     def _parse(self) -> None:
+        if self._can_parse_worksheets_in_processes:
+            self._parse_worksheets_in_processes()
+            return
+
         self.workbook = self._load_workbook()
         for worksheet in self.workbook.worksheets:
+            reset_worksheet_dimensions(worksheet)
             if not self._validate_worksheet(worksheet):
                 continue
             self._parse_worksheet(worksheet)
 
+    def _parse_worksheets_in_processes(self) -> None:
+        """Разбор листов в `max_workers` процессах, при `max_workers = None` по процессу на ядро.
+
+        Класс парсера должен быть импортируемым, в процессах он создаётся заново
+        с теми же именованными параметрами, что и текущий парсер.
+
+        """
+        titles = self._read_worksheet_titles()
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(
+                parse_worksheet,
+                itertools.repeat(type(self)),
+                itertools.repeat(self.file_path),
+                itertools.repeat(self._params),
+                titles,
+            )
+            for cleaned_data, errors, errors_by_row in results:
+                self.cleaned_data.extend(cleaned_data)
+                self.errors.extend(errors)
+                for row_index, row_errors in errors_by_row.items():
+                    self.errors_by_row[row_index].extend(row_errors)
+
+    def _read_worksheet_titles(self) -> List[str]:
+        """Названия листов книги, ячейки листов не читаются."""
+        if self.reader_backend == 'calamine':
+            return load_calamine_workbook(self.file_path, None).sheetnames
+        # read-only workbook only reads the list of worksheets, rows are read on iteration
+        workbook = load_workbook(filename=self.file_path, read_only=True)
+        try:
+            return [worksheet.title for worksheet in workbook.worksheets]
+        finally:
+            workbook.close()
+
     def _parse_worksheet(self, worksheet: Worksheet) -> None:
-        data = []
+        self.cleaned_data.extend(self.clean(list(self._parse_worksheet_iter(worksheet))))
 
+    def _parse_worksheet_iter(self, worksheet: Worksheet) -> Iterator[Dict]:
+        """Lazily parse worksheet rows, `clean` is not applied."""
         for row_index, row in self._iterate_worksheet_rows(worksheet):
             try:
                 row_data = self.parse_row(row, row_index, worksheet_title=worksheet.title)
             except SkipRow:
-                pass
-            else:
-                data.append(row_data)
-
-        self.cleaned_data.extend(self.clean(data))
+                continue
+            if row_data is not None:
+                yield row_data
+
+
+def parse_worksheet(
+    parser_class: Type[BaseMultipleSheetsXLSXParser],
+    file_path: Union[str, os.PathLike],
+    params: Dict[str, Any],
+    worksheet_title: str,
+) -> Tuple[List[Dict[str, Any]], List[str], Dict[Optional[int], List[str]]]:
+    """Разбор одного листа файла, возвращает данные листа и ошибки.
+
+    Функция объявлена на уровне модуля, чтобы её можно было передать в другой процесс.
+
+    """
+    parser = parser_class(file_path, **params)
+    parser.workbook = parser._load_workbook()
+    worksheet = parser.workbook[worksheet_title]
+    reset_worksheet_dimensions(worksheet)
+    if parser._validate_worksheet(worksheet):
+        parser._parse_worksheet(worksheet)
+    return parser.cleaned_data, parser.errors, dict(parser.errors_by_row)
@@ -1,4 +1,6 @@
 import datetime
+import functools
+import re
 import string
 import typing
 
@@ -26,6 +28,79 @@ def lower(value: Any) -> Any:
     return value
 
 
+# thousands may be separated by spaces ('1 000'), any other whitespace inside a number is not accepted
+INTEGER_THOUSANDS_SEPARATORS = ' \xa0\u202f'
+INTEGER_RE = re.compile(r'[+-]?(?:\d{1,3}(?:[ \xa0\u202f]\d{3})+|\d+)\Z')
+# integral numbers written with a fractional part ('10.0'), exponent forms ('1e3') are not accepted
+INTEGRAL_DECIMAL_RE = re.compile(r'[+-]?[0-9]+\.[0-9]+\Z')
+
+
+# strptime directives whose values are digits only, patterns accept everything strptime accepts for them
+NUMERIC_DATETIME_DIRECTIVES = {
+    '%Y': r'\d{4}',
+    '%y': r'\d{2}',
+    '%m': r'\d{1,2}',
+    '%d': r'\s?\d{1,2}',
+    '%H': r'\d{1,2}',
+    '%M': r'\d{1,2}',
+    '%S': r'\d{1,2}',
+    '%f': r'\d{1,6}',
+    '%%': '%',
+}
+DATETIME_FORMAT_TOKEN_RE = re.compile(r'%.|\s+')
+
+
+@functools.lru_cache(maxsize=None)
+def compile_datetime_format(date_format: str) -> typing.Optional[typing.Pattern]:
+    """Regex matching every value strptime could parse with date_format.
+
+    Returns None for formats with non-numeric directives, such values are always passed to strptime.
+    """
+    parts = []
+    position = 0
+    for match in DATETIME_FORMAT_TOKEN_RE.finditer(date_format):
+        parts.append(re.escape(date_format[position:match.start()]))
+        token = match.group()
+        if token.isspace():
+            parts.append(r'\s+')
+        elif token in NUMERIC_DATETIME_DIRECTIVES:
+            parts.append(NUMERIC_DATETIME_DIRECTIVES[token])
+        else:
+            return None
+        position = match.end()
+    parts.append(re.escape(date_format[position:]))
+    return re.compile(''.join(parts) + r'\Z', re.IGNORECASE)
+
+
+# values of these formats are parsed by datetime.fromisoformat, which is implemented in C
+ISO_DATETIME_FORMATS = {
+    '%Y-%m-%d': re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}\Z'),
+    '%Y-%m-%d %H:%M:%S': re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}:[0-9]{2}\Z'),
+    '%Y-%m-%dT%H:%M:%S': re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}\Z'),
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_datetime_by_formats(value: str, formats: typing.Tuple[str, ...]) -> typing.Optional[datetime.datetime]:
+    # spreadsheets tend to repeat the same dates, so the results (including misses) are cached
+    for date_format in formats:
+        iso_format_re = ISO_DATETIME_FORMATS.get(date_format)
+        if iso_format_re is not None and iso_format_re.match(value):
+            try:
+                return datetime.datetime.fromisoformat(value)
+            except ValueError:
+                continue
+        # formats that can't match are skipped without raising ValueError in strptime
+        format_re = compile_datetime_format(date_format)
+        if format_re is not None and format_re.match(value) is None:
+            continue
+        try:
+            return datetime.datetime.strptime(value, date_format)
+        except ValueError:
+            pass
+    return None
+
+
 class BaseProcessor:
     raise_error = True
     none_if_error = False
@@ -91,11 +166,8 @@ class StringProcessor(BaseProcessor):
         float_fix: bool = False,
         **kwargs: Any,
     ) -> None:
-        super().__init__(**kwargs)
+        super().__init__(strip_chars=strip_chars, strip_whitespace=strip_whitespace, **kwargs)
 
-        self.strip_chars = WHITESPACES if strip_whitespace else ''
-        if strip_chars:
-            self.strip_chars += strip_chars
         self.float_fix = float_fix
 
     def process_value(self, value: Any) -> typing.Optional[str]:
@@ -125,18 +197,31 @@ class LimitedStringProcessor(StringProcessor):
 
 
 class IntegerProcessor(BaseProcessor):
+    thousands_separators_translation = str.maketrans('', '', INTEGER_THOUSANDS_SEPARATORS)
+
     @staticmethod
     def _process_float_value(value: float) -> typing.Optional[int]:
         if value.is_integer():
             return int(value)
 
-    @staticmethod
-    def _process_str_value(value: str) -> typing.Optional[int]:
-        str_value = value.strip()
-        if str_value and str_value.isdigit():
-            return int(str_value)
+    @classmethod
+    def _process_str_value(cls, value: str) -> typing.Optional[int]:
+        str_value = value.strip(WHITESPACES)
+        # int() also accepts python literal underscores and inner whitespaces, the pattern accepts neither
+        if INTEGER_RE.match(str_value):
+            return int(str_value.translate(cls.thousands_separators_translation))
+        # integral numbers written as floats ('10.0') are accepted, as float cell values are,
+        # Decimal keeps them exact, float('9007199254740993.0') is 9007199254740992
+        if INTEGRAL_DECIMAL_RE.match(str_value):
+            decimal_value = Decimal(str_value)
+            if decimal_value == decimal_value.to_integral_value():
+                return int(decimal_value)
+        return None
 
     def process_value(self, value: Any) -> Any:
+        if type(value) is int:
+            return value
+
         int_value = value
         if isinstance(value, float):
             int_value = self._process_float_value(value)
@@ -171,8 +256,12 @@ class FloatProcessor(BaseProcessor):
         elif isinstance(value, int):
             float_value = float(value)
         else:
+            str_value = value if isinstance(value, str) else str(value)
+            # float() strips whitespaces itself, the string is copied only for a decimal comma
+            if ',' in str_value:
+                str_value = str_value.replace(',', '.')
             try:
-                float_value = float(str(value).strip().replace(',', '.'))
+                float_value = float(str_value)
             except (ValueError, TypeError):
                 raise ColumnError(f'{value} is not a floating point number.')
 
@@ -186,8 +275,12 @@ class DecimalProcessor(BaseProcessor):
         elif isinstance(value, (int, float)):
             decimal_value = Decimal(value)
         else:
+            str_value = value if isinstance(value, str) else str(value)
+            # Decimal() strips whitespaces itself, the string is copied only for a decimal comma
+            if ',' in str_value:
+                str_value = str_value.replace(',', '.')
             try:
-                decimal_value = Decimal(str(value).strip().replace(',', '.'))
+                decimal_value = Decimal(str_value)
             except InvalidOperation:
                 raise ColumnError(f'{value} is not a floating point number.')
 
@@ -211,6 +304,10 @@ class DecimalRangeProcessor(DecimalProcessor):
         return value
 
 
+DEFAULT_TRUE_VALUES = frozenset({True, 'True', 'true', '1', 'Да'})
+DEFAULT_FALSE_VALUES = frozenset({False, 'False', 'false', '0', 'Нет'})
+
+
 class BooleanProcessor(BaseProcessor):
     def __init__(
         self,
@@ -219,10 +316,9 @@ class BooleanProcessor(BaseProcessor):
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
-        default_true_values = {True, 'True', 'true', '1', 'Да'}
-        default_false_values = {False, 'False', 'false', '0', 'Нет'}
-        self.true_values = set(true_values) if true_values else default_true_values
-        self.false_values = set(false_values) if false_values else default_false_values
+        # values are looked up in the sets on every call, so changing them after creation takes effect
+        self.true_values = set(true_values or DEFAULT_TRUE_VALUES)
+        self.false_values = set(false_values or DEFAULT_FALSE_VALUES)
 
     def process_value(self, value: Any) -> Any:
         raw_value = value
@@ -246,6 +342,7 @@ class DateTimeProcessor(BaseProcessor):
     ) -> None:
         super().__init__(**kwargs)
         self.formats = formats
+        self._formats = tuple(formats) if formats else ()
         self.parser = parser or parse
         self.user_timezone = None
         if timezone:
@@ -256,7 +353,10 @@ class DateTimeProcessor(BaseProcessor):
                 raise ValueError(f'Unknown time zone.')
 
     def process_value(self, value: Any) -> Any:
-        if isinstance(value, str):
+        if type(value) is datetime.datetime:
+            # spreadsheet readers return ready datetimes, checked before the isinstance chain
+            pass
+        elif isinstance(value, str):
             value = self._get_datetime_from_string(value.strip())
         elif isinstance(value, datetime.datetime):
             pass
@@ -264,38 +364,65 @@ class DateTimeProcessor(BaseProcessor):
             value = datetime.datetime.combine(value, datetime.time.min)
         else:
             raise ColumnError(f'Unable to convert to date {value}.')
-        if self.user_timezone:
+        # pytz returns the same tzinfo object for UTC, such values don't need a conversion
+        if self.user_timezone and value.tzinfo is not self.user_timezone:
             value = value.astimezone(self.user_timezone)
         return value
 
     def _get_datetime_from_string(self, value: str) -> datetime.datetime:
         if not self.formats:
+            # parser results are not cached: dateutil fills missing fields from the current date
             try:
                 return self.parser(value)
             except ValueError:
                 raise ColumnError(f'Unable to convert "{value}" to date.')
-        for date_format in self.formats:
-            try:
-                return datetime.datetime.strptime(value, date_format)
-            except ValueError:
-                pass
-        raise ColumnError(f'Value "{value}" is not accordance with the format {self.formats}.')
+        datetime_value = parse_datetime_by_formats(value, self._formats)
+        if datetime_value is None:
+            raise ColumnError(f'Value "{value}" is not accordance with the format {self.formats}.')
+        return datetime_value
 
 
 class DateProcessor(DateTimeProcessor):
     def process_value(self, value: Any) -> Any:
+        # date cells don't need the round trip through datetime when there is no timezone conversion
+        if type(value) is datetime.date and not self.user_timezone:
+            return value
         value = super().process_value(value)
         return value.date()
 
 
+def is_valid_email(email: str, check_deliverability: bool = True) -> bool:
+    if not check_deliverability:
+        return is_valid_email_syntax(email)
+    # DNS answers change over time, so deliverability check results are not cached
+    try:
+        validate_email(email, check_deliverability=True)
+    except EmailNotValidError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=4096)
+def is_valid_email_syntax(email: str) -> bool:
+    # columns tend to repeat addresses, the syntax is checked once per address
+    try:
+        validate_email(email, check_deliverability=False)
+    except EmailNotValidError:
+        return False
+    return True
+
+
 class EmailProcessor(StringProcessor):
+    def __init__(self, *args: Any, check_deliverability: bool = True, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # the deliverability check makes a DNS query for every value
+        self.check_deliverability = check_deliverability
+
     def process_value(self, value: Any) -> typing.Optional[str]:
         email_value = super().process_value(value)
         if email_value:
             email_value = lower(email_value)
-            try:
-                validate_email(email_value)
-            except EmailNotValidError:
+            if not is_valid_email(email_value, self.check_deliverability):
                 raise ColumnError(f'{value} is not a valid postal address.')
             return email_value
 
@@ -307,9 +434,11 @@ class StringIsNoneProcessor(BaseProcessor):
 
     def process_value(self, value: Any) -> Any:
         if isinstance(value, str) and self.none_symbols:
-            symbols = {symbol for word in value.split() for symbol in word}
-            if symbols.issubset(self.none_symbols):
-                return None
+            none_symbols = self.none_symbols
+            for symbol in value:
+                if symbol not in none_symbols and not symbol.isspace():
+                    return value
+            return None
         return value
 
 
@@ -319,11 +448,8 @@ class StringsArrayProcessor(BaseProcessor):
         if values is None:
             return None
 
-        result_values = []
-        for value in values.split(','):
-            result_values.append(value.strip(self.strip_chars))
-
-        return result_values
+        strip_chars = self.strip_chars
+        return [item.strip(strip_chars) for item in values.split(',')]
 
 
 class ChoiceProcessor(BaseProcessor):
@@ -335,10 +461,15 @@ class ChoiceProcessor(BaseProcessor):
     ) -> None:
         self.choices = choices
         self.raw_value_processor = raw_value_processor or StringProcessor(**kwargs)
+        # strings are stripped inline with the default processor, as StringProcessor would do
+        self._strip_str_values = raw_value_processor is None
         super().__init__(**kwargs)
 
     def process_value(self, value: Any) -> Any:
-        value = self.raw_value_processor(value)
+        if self._strip_str_values and isinstance(value, str):
+            value = value.strip(self.raw_value_processor.strip_chars) or None
+        else:
+            value = self.raw_value_processor(value)
         try:
             return self.choices[value]
         except KeyError:
@@ -354,16 +485,45 @@ class ClassifierProcessor(BaseProcessor):
     ) -> None:
         self.choices = choices
         self.raw_value_processor = raw_value_processor or (lambda raw_value: raw_value)
+        # values are matched by a dict lookup, functions and unhashable values are checked one by one,
+        # positions keep the order of choices: the first matching choice wins
+        self._choices_by_value: Dict[Any, typing.Tuple[int, Any]] = {}
+        self._ordered_choices: List[typing.Tuple[int, Any, Any]] = []
+        for position, (item, choice_function) in enumerate(choices):
+            if callable(choice_function):
+                self._ordered_choices.append((position, item, choice_function))
+                continue
+            try:
+                self._choices_by_value.setdefault(choice_function, (position, item))
+            except TypeError:
+                self._ordered_choices.append((position, item, choice_function))
         super().__init__(**kwargs)
 
+    def _get_value_choice(self, value: Any) -> typing.Optional[typing.Tuple[int, Any]]:
+        try:
+            return self._choices_by_value.get(value)
+        except TypeError:
+            return None
+
+    @staticmethod
+    def _choice_matches(choice_function: Any, value: Any) -> bool:
+        if not callable(choice_function):
+            return choice_function == value
+        try:
+            return bool(choice_function(value))
+        except TypeError:
+            return False
+
     def process_value(self, value: Any) -> Any:
         value: Any = self.raw_value_processor(value)
-        for item, choice_function in self.choices:
-            if not callable(choice_function) and choice_function == value:
+        value_choice = self._get_value_choice(value)
+        # the choice found by value is returned unless a choice listed before it matches
+        last_position = value_choice[0] if value_choice is not None else len(self.choices)
+        for position, item, choice_function in self._ordered_choices:
+            if position > last_position:
+                break
+            if self._choice_matches(choice_function, value):
                 return item
-            try:
-                if choice_function(value):
-                    return item
-            except TypeError:
-                pass
+        if value_choice is not None:
+            return value_choice[1]
         raise ColumnError('Unknown value.')
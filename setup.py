@@ -45,6 +45,9 @@ setup(
         'xlrd>=1.2.0',
         'email-validator>=1.0.5',
     ],
+    extras_require={
+        'calamine': ['python-calamine>=0.2.0'],
+    },
     url='https://github.com/best-doctor/import_me',
     license='MIT',
     py_modules=[package_name],
@@ -4,8 +4,6 @@ import tempfile
 
 import pytest
 from openpyxl import Workbook
-from openpyxl.cell import Cell
-from openpyxl.worksheet.worksheet import Worksheet
 from pytz import timezone
 
 from import_me.columns import Column
@@ -76,22 +74,6 @@ def xlsx_parser():
     return Parser(file_path='test_file_path')
 
 
-@pytest.fixture
-def xlsx_cell_factory():
-    def cell(value):
-        return Cell(Worksheet(Workbook()), value=value)
-
-    return cell
-
-
-@pytest.fixture
-def xlsx_row_factory(xlsx_cell_factory):
-    def row(values):
-        return [xlsx_cell_factory(value) for value in values]
-
-    return row
-
-
 @pytest.fixture
 def workbook_factory():
     def _workbook_factory(
@@ -1,8 +1,11 @@
+from unittest.mock import MagicMock
+
 import pytest
 
 from import_me.columns import Column
 from import_me.exceptions import SkipRow, StopParsing, ColumnError
 from import_me.parsers.base import BaseParser
+from import_me.processors import StringProcessor
 from tests.conftest import raise_
 
 
@@ -54,11 +57,11 @@ def test_parse_row(row_factory):
 
     parser = Parser()
 
-    with pytest.raises(SkipRow) as exc_info:
-        parser.parse_row(row_factory(('Ivan', 'Ivanov', 'fail age')), 1)
+    skipped_result = parser.parse_row(row_factory(('Ivan', 'Ivanov', 'fail age')), 1)
     result = parser.parse_row(row_factory(('Ivan', 'Ivanov', 34)), 1)
 
-    assert exc_info.value.messages == ['Not processed because the string contains errors.']
+    assert skipped_result is None
+    assert parser.has_errors is True
     assert result == {
         'first_name': 'Ivan',
         'last_name': 'Ivanov',
@@ -67,6 +70,24 @@ def test_parse_row(row_factory):
     }
 
 
+def test_parse_row_interns_strings(row_factory):
+    class Parser(BaseParser):
+        columns = [
+            Column('city', index=0, intern=True),
+            Column('name', index=1),
+        ]
+
+    parser = Parser()
+    first_city, second_city = ''.join(['Mos', 'cow']), ''.join(['Mos', 'cow'])
+    first_name, second_name = ''.join(['Iv', 'an']), ''.join(['Iv', 'an'])
+
+    first_result = parser.parse_row(row_factory((first_city, first_name)), 1)
+    second_result = parser.parse_row(row_factory((second_city, second_name)), 2)
+
+    assert first_result['city'] is second_result['city']
+    assert first_result['name'] is not second_result['name']
+
+
 @pytest.mark.parametrize(
     'column_processor, expected_exception',
     (
@@ -88,6 +109,72 @@ def test_parse_column_exceptions(column_processor, expected_exception, row_facto
         parser.parse_column(row, parser.columns[0], row_index=0)
 
 
+@pytest.mark.parametrize('row_values', ([None, None], [None], []))
+def test_parse_row_skips_empty_row_without_processing(row_values, row_factory):
+    class Parser(BaseParser):
+        columns = [
+            Column('first_name', index=0, processor=StringProcessor()),
+            Column('last_name', index=1),
+        ]
+
+    parser = Parser()
+    parser._parse_cell = MagicMock()
+
+    assert parser.parse_row(row_factory(row_values), 1) is None
+    parser._parse_cell.assert_not_called()
+
+
+def test_parse_row_cleans_empty_row_with_column_clean_method(row_factory):
+    class Parser(BaseParser):
+        add_file_path = False
+        add_row_index = False
+        columns = [
+            Column('country', index=0),
+        ]
+
+        def clean_column_country(self, value):
+            return value or 'RU'
+
+    parser = Parser()
+
+    assert parser.parse_row(row_factory([None]), 1) == {'country': 'RU'}
+
+
+def test_parse_row_passes_empty_row_to_overridden_clean_row(row_factory):
+    class Parser(BaseParser):
+        columns = [
+            Column('name', index=0),
+        ]
+
+        def clean_row(self, row_data, row, row_index, worksheet_title=None):
+            if row_data['name'] is None:
+                self.add_errors('name is empty', row_index=row_index)
+            return super().clean_row(row_data, row, row_index, worksheet_title=worksheet_title)
+
+    parser = Parser()
+
+    with pytest.raises(SkipRow):
+        parser.parse_row(row_factory([None]), 5)
+    assert parser.errors == ['row: 5, name is empty']
+
+
+def test_parse_row_reports_processor_error_for_empty_row(row_factory):
+    def processor(value):
+        if value is None:
+            raise ValueError('value is required')
+        return value
+
+    class Parser(BaseParser):
+        columns = [
+            Column('first_name', index=0, processor=processor),
+        ]
+
+    parser = Parser()
+
+    assert parser.parse_row(row_factory([None]), 1) is None
+    assert parser.errors == ['row: 1, column: 0, value is required']
+
+
 def test_clean_row_required_columns():
     class Parser(BaseParser):
         columns = [
@@ -134,6 +221,53 @@ def test_clean_row_required_columns_exception():
     ]
 
 
+def test_overridden_clean_row_skips_row_without_required_columns(row_factory):
+    class Parser(BaseParser):
+        add_row_index = False
+        columns = [
+            Column('first_name', index=0),
+            Column('last_name', index=1, header='Last Name', required=True),
+        ]
+
+        def iterate_file_rows(self):
+            return enumerate([
+                row_factory(('Ivan', 'Ivanov')),
+                row_factory(('Petr', None)),
+                row_factory(('Sidor', 'Sidorov')),
+            ])
+
+        def clean_row(self, row_data, row, row_index, worksheet_title=None):
+            row_data = super().clean_row(row_data, row, row_index, worksheet_title=worksheet_title)
+            row_data['full_name'] = f'{row_data["first_name"]} {row_data["last_name"]}'
+            return row_data
+
+    parser = Parser()
+    parser.parse_data()
+
+    assert [row['full_name'] for row in parser.cleaned_data] == ['Ivan Ivanov', 'Sidor Sidorov']
+    assert parser.errors == ['row: 1, column: 1, Column Last Name is required.']
+
+
+def test_clean_unique_together_values_exception():
+    class Parser(BaseParser):
+        columns = [
+            Column('first_name', index=0),
+            Column('last_name', index=1),
+        ]
+        unique_together = [['first_name', 'last_name']]
+
+    parser = Parser()
+    row_data = {'first_name': 'Ivan', 'last_name': 'Ivanov'}
+
+    result = parser.clean_unique_together_values(row_data=row_data, row=list(row_data.values()), row_index=1)
+    with pytest.raises(SkipRow) as exc_info:
+        parser.clean_unique_together_values(row_data=dict(row_data), row=list(row_data.values()), row_index=2)
+
+    assert result == row_data
+    assert exc_info.value.messages == ['Row 2 is not unique.']
+    assert parser.errors == ['row: 2, first_name (Ivan), last_name (Ivanov) is a duplicate of row 1']
+
+
 @pytest.mark.parametrize(
     'messages, row_index, col_index, expected_parser_errors',
     (
@@ -194,6 +328,28 @@ def test_parser_custom_column_clean_method(workbook_factory):
     assert result == {'column1': 'any value'}
 
 
+def test_parse_row_calls_overridden_column_hooks():
+    class Parser(BaseParser):
+        add_file_path = False
+        add_row_index = False
+        columns = [
+            Column('column1', index=0),
+            Column('column2', index=1),
+        ]
+
+        def parse_column(self, row, column, row_index):
+            return f'parsed {super().parse_column(row, column, row_index)}'
+
+        def clean_column(self, column, value):
+            return value.upper()
+
+    parser = Parser(file_path='file')
+
+    result = parser.parse_row(row=['column1_data', 'column2_data'], row_index=1)
+
+    assert result == {'column1': 'parsed COLUMN1_DATA', 'column2': 'parsed COLUMN2_DATA'}
+
+
 @pytest.mark.parametrize(('expected', 'given', 'result'), [
     ([], [], []),
     (['foo'], ['foo'], []),
@@ -210,3 +366,37 @@ def test_check_column_headers(expected, given, result):
         {key: value for key, value in enumerate(expected)},
         {key: value for key, value in enumerate(given)},
     ) == result
+
+
+def test_expected_headers_are_collected_per_class():
+    class Parser(BaseParser):
+        columns = [
+            Column('first_name', index=0, header='First Name'),
+            Column('last_name', index=1, header='Last Name', validate_header=False),
+            Column('age', index=2),
+        ]
+
+    class ChildParser(Parser):
+        pass
+
+    class OtherParser(Parser):
+        columns = [Column('email', index=3, header='Email')]
+
+    assert Parser()._expected_headers == {0: 'first name'}
+    assert ChildParser()._expected_headers == {0: 'first name'}
+    assert OtherParser()._expected_headers == {3: 'email'}
+    assert Parser()._expected_headers is Parser()._expected_headers
+
+
+def test_expected_headers_follow_columns_from_mixin_and_reassigned_columns():
+    class ColumnsMixin:
+        columns = [Column('first_name', index=0, header='First Name')]
+
+    class Parser(ColumnsMixin, BaseParser):
+        pass
+
+    assert Parser()._expected_headers == {0: 'first name'}
+
+    Parser.columns = [Column('email', index=1, header='Email')]
+
+    assert Parser()._expected_headers == {1: 'email'}
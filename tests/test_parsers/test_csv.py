@@ -1,5 +1,17 @@
+import pytest
+
 from import_me.columns import Column
+from import_me.parsers.base import BaseMultipleFileParser
 from import_me.parsers.csv import BaseCSVParser
+from import_me.processors import IntegerProcessor, StringProcessor
+
+
+class PersonCSVParser(BaseCSVParser):
+    add_file_path = True
+    columns = [
+        Column('first_name', index=0, header='First Name'),
+        Column('age', index=1, header='Age', processor=IntegerProcessor()),
+    ]
 
 
 def test_base_csv_parser(csv_file_factory):
@@ -33,6 +45,81 @@ def test_base_csv_parser(csv_file_factory):
     ]
 
 
+def test_base_csv_parser_accepts_binary_file_object(csv_file_factory):
+    class CSVParser(BaseCSVParser):
+        columns = [
+            Column('first_name', index=0, header='Имя'),
+            Column('last_name', index=1, header='Фамилия'),
+        ]
+
+    csv_file = csv_file_factory(
+        header=['Имя', 'Фамилия'],
+        data=[['Иван', 'Иванов']],
+        file_kwargs={'encoding': 'utf-8'},
+    )
+    parser = CSVParser(file_contents=csv_file)
+    parser()
+
+    assert parser.has_errors is False
+    assert parser.cleaned_data == [{'first_name': 'Иван', 'last_name': 'Иванов', 'row_index': 1}]
+
+
+@pytest.mark.parametrize(
+    'header_row_index, first_data_row_index, last_data_row_index, expected_names',
+    (
+        (0, 1, None, ['Ivan', 'Petr', 'Sidor']),
+        (0, 2, 3, ['Petr']),
+        (1, 2, None, ['Petr', 'Sidor']),
+        (1, 0, 3, ['Ivan', 'Petr']),
+    ),
+)
+def test_base_csv_parser_row_range(
+    header_row_index, first_data_row_index, last_data_row_index, expected_names, tmp_path,
+):
+    class CSVParser(BaseCSVParser):
+        columns = [Column('first_name', index=0, header='First Name')]
+
+    CSVParser.header_row_index = header_row_index
+    CSVParser.first_data_row_index = first_data_row_index
+    CSVParser.last_data_row_index = last_data_row_index
+
+    rows = [['Ivan'], ['Petr'], ['Sidor']]
+    rows.insert(header_row_index, ['First Name'])
+    csv_path = tmp_path / 'persons.csv'
+    csv_path.write_text(''.join(f'{row[0]}\n' for row in rows))
+
+    parser = CSVParser(file_path=csv_path)
+    rows_data = [row for _row_index, row in parser.iterate_file_rows()]
+
+    assert parser.has_errors is False
+    assert [row[0] for row in rows_data if row[0] != 'First Name'] == expected_names
+
+
+def test_base_csv_parser_parse_iter(csv_file_factory):
+    class CSVParser(BaseCSVParser):
+        columns = [
+            Column('first_name', index=0, header='First Name'),
+            Column('last_name', index=1, header='Last Name', processor=StringProcessor(), required=True),
+        ]
+
+    csv_file = csv_file_factory(
+        header=['First Name', 'Last Name'],
+        data=[
+            ['Ivan', 'Ivanov'],
+            ['Petr', None],
+            ['Sidor', 'Sidorov'],
+        ],
+    )
+    parser = CSVParser(file_path=csv_file.name)
+    rows = parser.parse_iter()
+
+    assert next(rows) == {'first_name': 'Ivan', 'last_name': 'Ivanov', 'row_index': 1}
+    assert parser.has_errors is False
+    assert next(rows) == {'first_name': 'Sidor', 'last_name': 'Sidorov', 'row_index': 3}
+    assert parser.errors == ['row: 2, column: 1, Column Last Name is required.']
+    assert parser.cleaned_data == []
+
+
 def test_base_csv_parser_additional_params(csv_file_factory):
     class CSVParser(BaseCSVParser):
         columns = [
@@ -126,3 +213,28 @@ def test_parser_unique_together_column(csv_file_factory):
         {'first_name': 'Ivan', 'last_name': 'Ivanov', 'middle_name': 'Ivanovich', 'row_index': 1},
         {'first_name': 'Petr', 'last_name': 'Petrov', 'middle_name': 'Petrovich', 'row_index': 4},
     ]
+
+
+@pytest.mark.parametrize('max_workers', [1, 2, None])
+def test_multiple_file_parser(max_workers, tmp_path):
+    class MultipleCSVFileParser(BaseMultipleFileParser):
+        parser_class = PersonCSVParser
+        filename_patterns = ['*.csv']
+
+    (tmp_path / 'first.csv').write_text('First Name,Age\nIvan,30\n')
+    (tmp_path / 'second.csv').write_text('First Name,Age\nPetr,age\nSidor,40\n')
+    (tmp_path / 'third.csv').write_text('Name,Age\nPavel,50\n')
+    parser = MultipleCSVFileParser(tmp_path)
+    parser.max_workers = max_workers
+
+    parser()
+
+    assert parser.cleaned_data == [
+        {'first_name': 'Ivan', 'age': 30, 'file_path': tmp_path / 'first.csv', 'row_index': 1},
+        {'first_name': 'Sidor', 'age': 40, 'file_path': tmp_path / 'second.csv', 'row_index': 2},
+    ]
+    assert parser.errors == [
+        f'{tmp_path / "second.csv"}, row: 1, column: 1, age is not an integer.',
+        f'{tmp_path / "third.csv"}, Incorrect column names in the file: {tmp_path / "third.csv"}.',
+        f'{tmp_path / "third.csv"}, column 1 «name» not equal expected «first name»',
+    ]
@@ -133,6 +133,53 @@ def test_dataclass_dto_xlsx_parser_clean_column(xlsx_file_factory):
     assert persons.parsed_items[1].first_name == 'Petr'
 
 
+def test_dataclass_dto_parser_class_is_reused(xlsx_file_factory):
+    @dataclasses.dataclass
+    class PersonDto(DataclassImportableDtoMixin):
+        class ParserMeta:
+            first_data_row_index = 0
+
+        parser_base = BaseXLSXParser
+        row_index: int
+        first_name: str = dataclasses.field(metadata={META_HEADER: 'First Name'})
+        last_name: str = dataclasses.field(metadata={META_HEADER: 'Last Name'})
+
+    fields = PersonDto._get_fields()
+    first_parser = PersonDto._construct_parser(fields=fields, file_path='first.xlsx')
+    second_parser = PersonDto._construct_parser(fields=fields, file_path='second.xlsx')
+
+    assert type(first_parser) is type(second_parser)
+    assert issubclass(type(first_parser), BaseXLSXParser)
+    assert first_parser.first_data_row_index == 0
+    assert [column.name for column in first_parser.columns] == ['first_name', 'last_name']
+    assert second_parser.file_path == 'second.xlsx'
+    assert PersonDto._get_fields() is fields
+
+
+def test_dataclass_dto_parser_class_follows_fields_and_parser_meta():
+    @dataclasses.dataclass
+    class PersonDto(DataclassImportableDtoMixin):
+        class ParserMeta:
+            first_data_row_index = 0
+
+        parser_base = BaseXLSXParser
+        first_name: str = dataclasses.field(metadata={META_HEADER: 'First Name'})
+        last_name: str = dataclasses.field(metadata={META_HEADER: 'Last Name'})
+
+    fields = PersonDto._get_fields()
+    parser_class = PersonDto._get_parser_class(fields)
+    first_name_parser_class = PersonDto._get_parser_class(fields[:1])
+
+    assert [column.name for column in first_name_parser_class.columns] == ['first_name']
+
+    PersonDto.ParserMeta.first_data_row_index = 2
+    changed_meta_parser_class = PersonDto._get_parser_class(fields)
+
+    assert changed_meta_parser_class is not parser_class
+    assert changed_meta_parser_class.first_data_row_index == 2
+    assert PersonDto._get_parser_class(fields) is changed_meta_parser_class
+
+
 def test_parser_unique_column(xlsx_file_factory):
     @dataclasses.dataclass
     class IdDto(DataclassImportableDtoMixin):
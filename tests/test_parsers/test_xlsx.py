@@ -1,3 +1,4 @@
+import datetime
 import sys
 from unittest.mock import MagicMock
 
@@ -7,7 +8,13 @@ from openpyxl.workbook import Workbook
 
 from import_me.columns import Column
 from import_me.exceptions import StopParsing
-from import_me.parsers.xlsx import BaseXLSXParser, BaseMultipleSheetsXLSXParser
+from import_me.parsers.xlsx import (
+    BaseXLSXParser,
+    BaseMultipleSheetsXLSXParser,
+    XlrdWorksheet,
+    is_small_workbook,
+    reset_worksheet_dimensions,
+)
 from import_me.processors import FloatProcessor, StringsArrayProcessor
 
 DEFAULT_WORKBOOK_DATA = {
@@ -21,6 +28,15 @@ DEFAULT_PARSER_COLUMNS = [
 ]
 
 
+class PersonMultipleSheetsXLSXParser(BaseMultipleSheetsXLSXParser):
+    columns = DEFAULT_PARSER_COLUMNS
+
+
+class PrefixedPersonMultipleSheetsXLSXParser(PersonMultipleSheetsXLSXParser):
+    def clean_column_first_name(self, value):
+        return f'{self._params["prefix"]}{value}'
+
+
 def test_base_xlsx_parser(xlsx_file_factory):
     class XLSXParser(BaseXLSXParser):
         columns = DEFAULT_PARSER_COLUMNS
@@ -98,6 +114,84 @@ def test_base_xlsx_parser_accepts_file_content(xlsx_file_factory):
     ]
 
 
+@pytest.mark.parametrize('file_contents', [False, True])
+def test_base_xlsx_parser_calamine_backend(file_contents, xlsx_file_factory):
+    pytest.importorskip('python_calamine')
+
+    class XLSXParser(BaseXLSXParser):
+        reader_backend = 'calamine'
+        columns = DEFAULT_PARSER_COLUMNS + [
+            Column('age', index=2),
+            Column('birthday', index=3),
+        ]
+
+    xlsx_file = xlsx_file_factory(
+        header=['First Name', 'Last Name'],
+        data=[['Ivan', 'Ivanov', 30, datetime.datetime(1990, 1, 2)], [None, 'Petrov', 1.5, None]],
+    )
+    if file_contents:
+        parser = XLSXParser(file_contents=xlsx_file)
+    else:
+        parser = XLSXParser(file_path=xlsx_file.name)
+
+    parser()
+
+    assert parser.has_errors is False
+    assert parser.cleaned_data == [
+        {
+            'first_name': 'Ivan', 'last_name': 'Ivanov', 'age': 30,
+            'birthday': datetime.datetime(1990, 1, 2), 'row_index': 1,
+        },
+        {'first_name': None, 'last_name': 'Petrov', 'age': 1.5, 'birthday': None, 'row_index': 2},
+    ]
+
+
+@pytest.mark.parametrize(
+    'min_row, max_row, expected_values',
+    (
+        (None, None, [['First Name', 'Birth Date'], ['Ivan', datetime.datetime(2020, 1, 1)], ['Petr', '']]),
+        (2, None, [['Ivan', datetime.datetime(2020, 1, 1)], ['Petr', '']]),
+        (2, 2, [['Ivan', datetime.datetime(2020, 1, 1)]]),
+        (3, 10, [['Petr', '']]),
+    ),
+)
+def test_xlrd_worksheet_iter_rows(min_row, max_row, expected_values):
+    rows = [
+        (['First Name', 'Birth Date'], [1, 1]),
+        (['Ivan', 43831.0], [1, 3]),
+        (['Petr', ''], [1, 3]),
+    ]
+    xls_sheet = MagicMock(nrows=len(rows))
+    xls_sheet.row_values.side_effect = lambda row: rows[row][0]
+    xls_sheet.row_types.side_effect = lambda row: rows[row][1]
+    worksheet = XlrdWorksheet(xls_sheet, datemode=0)
+
+    values = [[cell.value for cell in row] for row in worksheet.iter_rows(min_row=min_row, max_row=max_row)]
+    assert [list(row) for row in worksheet.iter_rows(min_row=min_row, max_row=max_row, values_only=True)] == values
+    assert [
+        list(row) for row in worksheet.iter_rows(min_row=min_row, max_row=max_row, max_col=1, values_only=True)
+    ] == [row_values[:1] for row_values in values]
+
+    assert values == expected_values
+
+
+@pytest.mark.parametrize(
+    'max_row, max_column, is_reset',
+    (
+        (1, 1, True),
+        (1048576, 16384, True),
+        (10, 2, False),
+        (None, None, False),
+    ),
+)
+def test_reset_worksheet_dimensions(max_row, max_column, is_reset):
+    worksheet = MagicMock(max_row=max_row, max_column=max_column)
+
+    reset_worksheet_dimensions(worksheet)
+
+    assert worksheet.reset_dimensions.called is is_reset
+
+
 def test_base_xlsx_parser_without_header(xlsx_file_factory):
     class XLSXParser(BaseXLSXParser):
         columns = [
@@ -500,11 +594,16 @@ def test_base_multiple_sheets_xlsx_parser_parse_worksheet_with_errors(workbook_f
     ]
 
 
-def test_base_multiple_sheets_xlsx_parser_parse(xlsx_file_factory):
+@pytest.mark.parametrize('reader_backend', ['openpyxl', 'calamine'])
+def test_base_multiple_sheets_xlsx_parser_parse(reader_backend, xlsx_file_factory):
+    if reader_backend == 'calamine':
+        pytest.importorskip('python_calamine')
 
     class MultipleSheetsXLSXParser(BaseMultipleSheetsXLSXParser):
         columns = DEFAULT_PARSER_COLUMNS
 
+    MultipleSheetsXLSXParser.reader_backend = reader_backend
+
     xlsx_file = xlsx_file_factory(worksheets_count=2, **DEFAULT_WORKBOOK_DATA)
     parser = MultipleSheetsXLSXParser(file_path=xlsx_file.name)
 
@@ -518,6 +617,37 @@ def test_base_multiple_sheets_xlsx_parser_parse(xlsx_file_factory):
     ]
 
 
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_base_multiple_sheets_xlsx_parser_parse_in_processes(max_workers, xlsx_file_factory):
+    xlsx_file = xlsx_file_factory(
+        worksheets_count=2, header=['First Name', 'Last Name'], data=[['Ivan', 'Ivanov'], [None, None], ['Petr', 1]],
+    )
+    parser = PersonMultipleSheetsXLSXParser(file_path=xlsx_file.name)
+    parser.max_workers = max_workers
+
+    parser.parse_data()
+
+    assert parser.cleaned_data == [
+        {'worksheet': '0', 'first_name': 'Ivan', 'last_name': 'Ivanov', 'row_index': 1},
+        {'worksheet': '0', 'first_name': 'Petr', 'last_name': 1, 'row_index': 3},
+        {'worksheet': '1', 'first_name': 'Ivan', 'last_name': 'Ivanov', 'row_index': 1},
+        {'worksheet': '1', 'first_name': 'Petr', 'last_name': 1, 'row_index': 3},
+    ]
+    assert parser.has_errors is False
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_base_multiple_sheets_xlsx_parser_parse_in_processes_with_params(max_workers, xlsx_file_factory):
+    xlsx_file = xlsx_file_factory(worksheets_count=2, **DEFAULT_WORKBOOK_DATA)
+    parser = PrefixedPersonMultipleSheetsXLSXParser(file_path=xlsx_file.name, prefix='Mr. ')
+    parser.max_workers = max_workers
+
+    parser.parse_data()
+
+    assert [row['first_name'] for row in parser.cleaned_data] == ['Mr. Ivan', 'Mr. Petr', 'Mr. Ivan', 'Mr. Petr']
+    assert parser.has_errors is False
+
+
 def test_base_multiple_sheets_xlsx_parser_parse_data_error(xlsx_file_factory):
     class MultipleSheetsXLSXParser(BaseMultipleSheetsXLSXParser):
         columns = DEFAULT_PARSER_COLUMNS
@@ -529,3 +659,41 @@ def test_base_multiple_sheets_xlsx_parser_parse_data_error(xlsx_file_factory):
     parser.parse_data()
 
     assert parser.errors[0] == 'Test exception'
+
+
+@pytest.mark.parametrize(
+    'threshold_bytes, expected_result',
+    [
+        (None, False),
+        (1, False),
+        (1024 * 1024, True),
+    ],
+)
+def test_is_small_workbook(threshold_bytes, expected_result, xlsx_file_factory):
+    xlsx_file = xlsx_file_factory(**DEFAULT_WORKBOOK_DATA)
+
+    assert is_small_workbook(xlsx_file.name, threshold_bytes) is expected_result
+
+
+def test_is_small_workbook_not_xlsx_file(csv_file_factory):
+    csv_file = csv_file_factory(**DEFAULT_WORKBOOK_DATA)
+
+    assert is_small_workbook(csv_file.name, 1024 * 1024) is False
+
+
+def test_base_xlsx_parser_loads_small_workbook_without_read_only(xlsx_file_factory):
+    class XLSXParser(BaseXLSXParser):
+        columns = DEFAULT_PARSER_COLUMNS
+        read_only_threshold_bytes = 1024 * 1024
+
+    xlsx_file = xlsx_file_factory(**DEFAULT_WORKBOOK_DATA)
+    parser = XLSXParser(file_path=xlsx_file.name)
+
+    assert parser._load_workbook_from_xlsx().read_only is False
+
+    parser._parse()
+
+    assert parser.cleaned_data == [
+        {'first_name': 'Ivan', 'last_name': 'Ivanov', 'row_index': 1},
+        {'first_name': 'Petr', 'last_name': 'Petrov', 'row_index': 2},
+    ]
@@ -3,6 +3,7 @@ import string
 from decimal import Decimal
 
 import pytest
+import pytz
 
 from import_me.exceptions import StopParsing, ColumnError
 from import_me.constants import WHITESPACES
@@ -11,6 +12,7 @@ from import_me.processors import (
     StringProcessor, StringIsNoneProcessor, BooleanProcessor, IntegerProcessor,
     DecimalProcessor, FloatProcessor, EmailProcessor, ChoiceProcessor, ClassifierProcessor,
     StringsArrayProcessor, DecimalRangeProcessor, IntegerRangeProcessor, LimitedStringProcessor,
+    parse_datetime_by_formats, compile_datetime_format, is_valid_email_syntax,
 )
 from tests.conftest import (
     raise_, choices_classifier_datetime_processor, choices_classifier_integer_processor,
@@ -177,6 +179,44 @@ def test_datetime_processor(user_timezone, formats, parser, value, expected_valu
     assert processor(value) == expected_value
 
 
+@pytest.mark.parametrize(
+    'value, formats, expected_value',
+    (
+        ('20.07.2019', ('%Y-%m-%d', '%d.%m.%Y'), datetime.datetime(2019, 7, 20)),
+        ('2019-07-20', ('%Y-%m-%d', '%d.%m.%Y'), datetime.datetime(2019, 7, 20)),
+        ('2019_07_20', ('%Y-%m-%d', '%d.%m.%Y'), None),
+        ('20.07.2019', (), None),
+        ('2019-7-2', ('%Y-%m-%d',), datetime.datetime(2019, 7, 2)),
+        ('2019-02-30', ('%Y-%m-%d',), None),
+        ('2019-07-20 10:11:12', ('%Y-%m-%d',), None),
+        ('2019-07-20T10:11:12', ('%Y-%m-%dT%H:%M:%S',), datetime.datetime(2019, 7, 20, 10, 11, 12)),
+        ('2019-07-02', ('%Y-%d-%m', '%Y-%m-%d'), datetime.datetime(2019, 2, 7)),
+    ),
+)
+def test_parse_datetime_by_formats(value, formats, expected_value):
+    assert parse_datetime_by_formats(value, formats) == expected_value
+    assert parse_datetime_by_formats(value, formats) == expected_value
+
+
+@pytest.mark.parametrize(
+    'date_format, value, is_matched',
+    (
+        ('%d.%m.%Y', '01.02.2020', True),
+        ('%d.%m.%Y', ' 1.2.2020', True),
+        ('%d.%m.%Y', '2020-02-01', False),
+        ('%Y-%m-%dT%H:%M:%S', '2020-01-02t10:11:12', True),
+        ('%d %m %Y', '1  2   2020', True),
+        ('%d.%m.%Y', '01.02.2020 10:00', False),
+    ),
+)
+def test_compile_datetime_format(date_format, value, is_matched):
+    assert bool(compile_datetime_format(date_format).match(value)) is is_matched
+
+
+def test_compile_datetime_format_non_numeric_directive():
+    assert compile_datetime_format('%d %b %Y') is None
+
+
 def test_datetime_processor_error_value():
     processor = DateTimeProcessor(formats=['%d.%m.%Y'])
 
@@ -191,6 +231,26 @@ def test_datetime_processor_error_date_value():
         assert processor('2019_01_01')
 
 
+def test_datetime_processor_value_in_user_timezone():
+    value = datetime.datetime(2019, 7, 20, 12, 43, 52, tzinfo=pytz.utc)
+    processor = DateTimeProcessor(timezone='UTC')
+
+    assert processor(value) is value
+
+
+def test_datetime_processor_parser_called_for_every_value():
+    parsed_values = []
+
+    def parser(value):
+        parsed_values.append(value)
+        return datetime.datetime.strptime(value, '%d.%m.%Y')
+
+    processor = DateTimeProcessor(parser=parser)
+
+    assert processor('01.01.2019') == processor(' 01.01.2019 ') == datetime.datetime(2019, 1, 1)
+    assert parsed_values == ['01.01.2019', '01.01.2019']
+
+
 @pytest.mark.parametrize(
     'formats, parser, value, expected_value',
     (
@@ -207,6 +267,8 @@ def test_datetime_processor_error_date_value():
         ([], None, '20.07.2019 12:43:52', datetime.date(2019, 7, 20)),
         ('', None, '20.07.2019 12:43:52', datetime.date(2019, 7, 20)),
         (None, lambda x: datetime.datetime(2020, 1, 1), '20.07.2019 12:43:52', datetime.date(2020, 1, 1)),
+        (None, None, datetime.date(2019, 7, 20), datetime.date(2019, 7, 20)),
+        (None, None, datetime.datetime(2019, 7, 20, 12, 43, 52), datetime.date(2019, 7, 20)),
     ),
 )
 def test_date_processor(formats, parser, value, expected_value):
@@ -341,6 +403,19 @@ def test_boolean_processor_custom_values(value, expected_value):
     assert processor(value) is expected_value
 
 
+def test_boolean_processor_changed_values():
+    processor = BooleanProcessor()
+
+    processor.true_values.add('Yes')
+    processor.false_values = {'No'}
+
+    assert processor('Yes') is True
+    assert processor('No') is False
+    with pytest.raises(ColumnError):
+        processor('false')
+    assert 'Yes' not in BooleanProcessor().true_values
+
+
 def test_boolean_processor_exception():
     processor = BooleanProcessor(true_values=['Yes'], false_values=['No'])
 
@@ -356,6 +431,16 @@ def test_boolean_processor_exception():
         (10, 10),
         (10.0, 10),
         ('  10  ', 10),
+        ('-10', -10),
+        ('+10', 10),
+        ('1 000', 1000),
+        ('1\xa0000', 1000),
+        ('-1 000 000', -1000000),
+        ('\uff11\uff12\uff13', 123),
+        ('10.0', 10),
+        ('-10.00', -10),
+        ('12345678901234567890.0', 12345678901234567890),
+        ('9007199254740993.0', 9007199254740993),
         (' \xa0\n', None),
     ),
 )
@@ -370,6 +455,15 @@ def test_integer_processor(value, expected_value):
     (
         (10.1, '10.1 is not an integer.'),
         ('Not integer', 'Not integer is not an integer.'),
+        ('1_000', '1_000 is not an integer.'),
+        ('1 0', '1 0 is not an integer.'),
+        ('12 34 5', '12 34 5 is not an integer.'),
+        ('1  000', '1  000 is not an integer.'),
+        ('10.5', '10.5 is not an integer.'),
+        ('1.0000000000000001', '1.0000000000000001 is not an integer.'),
+        ('1e3', '1e3 is not an integer.'),
+        ('1.0e3', '1.0e3 is not an integer.'),
+        ('inf', 'inf is not an integer.'),
         (
             datetime.datetime(2020, 1, 1),
             '2020-01-01 00:00:00 is not an integer.',
@@ -422,6 +516,7 @@ def test_integer_range_processor_exception(value, min_value, max_value, expected
         (10.1, Decimal(10.1)),
         ('10.123', Decimal('10.123')),
         ('    123,22  \n', Decimal('123.22')),
+        ('\xa0123.22\t', Decimal('123.22')),
         (' \xa0\n', None),
     ),
 )
@@ -487,6 +582,7 @@ def test_decimal_range_processor_exception(value, min_value, max_value, expected
         (10.1, float(10.1)),
         ('10.123', float('10.123')),
         ('    123,22  \n', float('123.22')),
+        ('\xa0123.22\t', float('123.22')),
         (' \xa0\n', None),
     ),
 )
@@ -532,6 +628,53 @@ def test_email_processor(value, expected_value):
     assert processor(value) == expected_value
 
 
+@pytest.mark.parametrize(
+    'value, is_valid',
+    (
+        ('user@example.com', True),
+        ('user@', False),
+        ('user@example', False),
+    ),
+)
+def test_email_processor_without_deliverability_check(value, is_valid):
+    processor = EmailProcessor(check_deliverability=False, raise_error=False, none_if_error=True)
+
+    assert (processor(value) is not None) is is_valid
+
+
+def test_email_processor_positional_arguments():
+    processor = EmailProcessor('<>')
+
+    assert processor.strip_chars.endswith('<>')
+    assert processor.check_deliverability is True
+
+
+def test_email_processor_validates_address_once(monkeypatch):
+    validated_emails = []
+    monkeypatch.setattr(
+        'import_me.processors.validate_email',
+        lambda email, check_deliverability: validated_emails.append(email),
+    )
+    is_valid_email_syntax.cache_clear()
+    processor = EmailProcessor(check_deliverability=False)
+
+    assert processor('User@Example.com') == processor('user@example.com') == 'user@example.com'
+    assert validated_emails == ['user@example.com']
+    is_valid_email_syntax.cache_clear()
+
+
+def test_email_processor_checks_deliverability_for_every_value(monkeypatch):
+    validated_emails = []
+    monkeypatch.setattr(
+        'import_me.processors.validate_email',
+        lambda email, check_deliverability: validated_emails.append((email, check_deliverability)),
+    )
+    processor = EmailProcessor()
+
+    assert processor('user@example.com') == processor('user@example.com') == 'user@example.com'
+    assert validated_emails == [('user@example.com', True), ('user@example.com', True)]
+
+
 @pytest.mark.parametrize(
     'value, expected_error_message',
     (
@@ -624,6 +767,29 @@ def test_classifier_processor(value, choices, raw_value_processor, expected_valu
     assert processor(value) == expected_value
 
 
+@pytest.mark.parametrize(
+    'value, expected_value',
+    [
+        (5, 'a'),
+        (50, 'c'),
+        ('50', 'b'),
+        ([50], 'd'),
+    ],
+)
+def test_classifier_processor_choices_order(value, expected_value):
+    choices = [
+        ['a', lambda x: x == 5],
+        ['b', lambda x: isinstance(x, str)],
+        ['c', 50],
+        ['c', 5],
+        ['d', [50]],
+        ['e', '50'],
+    ]
+    processor = ClassifierProcessor(choices=choices)
+
+    assert processor(value) == expected_value
+
+
 @pytest.mark.parametrize(
     'value, choices, raw_value_processor, expected_error_message',
     [
@@ -661,7 +827,7 @@ def test_classifier_integer_processor(value, choices, raw_value_processor, expec
     'value, choices, raw_value_processor, expected_error_message',
     [
         (
-            '-10', choices_classifier_integer_processor, IntegerProcessor(), '-10 is not an integer.',
+            '-10', choices_classifier_integer_processor, IntegerProcessor(), 'Unknown value.',
         ),
         (
             -10, choices_classifier_integer_processor, IntegerProcessor(), 'Unknown value.',